@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""GTD Voice App - parse_voice_input microbenchmark
+
+Usage: python benchmarks/bench_parser.py [seconds]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'webapp'))
+
+from gtd_data import gtd_items
+from voice_parser import parse_voice_input
+
+# Typical dictated commands on top of every item title in the seed data
+UTTERANCES = [
+    'Call John about the project - high priority',
+    'Buy groceries on the way home',
+    'Think about business plan - critical',
+    'Waiting for client feedback on proposal',
+    'complete email the HPE clearbook deck',
+    'delete old laptop backups',
+    'update Riyadh Air safety sense storyboard, urgent',
+    'Someday maybe learn to paint',
+    'Weekly review of the World Bank skills framework',
+    'Read article on prompt engineering for Claude',
+    'Book doctor appointment for dad when possible',
+    'Recurring monthly invoice for AstraZeneca webinar tours',
+]
+
+
+def corpus():
+    return UTTERANCES + [item['item'] for item in gtd_items]
+
+
+def run(seconds=2.0):
+    """Parse the corpus repeatedly for about `seconds`; returns parses/sec"""
+    texts = corpus()
+    parses = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for text in texts:
+            parse_voice_input(text)
+        parses += len(texts)
+    return parses / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    print(f"🎤 {len(corpus())} utterances, {seconds:g}s")
+    print(f"⚡ {run(seconds):,.0f} parses/sec")
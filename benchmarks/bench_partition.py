@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""GTD Workbook Builder - sheet partitioning microbenchmark
+
+Usage: python benchmarks/bench_partition.py [items]
+"""
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from gtd_data import gtd_items
+from gtd_workbook import GTD_SHEETS, MASTER_SHEETS, partition
+
+
+def dataset(n):
+    """n items drawn from the seed data"""
+    rng = random.Random(n)
+    return [dict(rng.choice(gtd_items), id=i) for i in range(1, n + 1)]
+
+
+def run(items, spec):
+    """Seconds to route every item to its sheets"""
+    start = time.perf_counter()
+    partition(items, spec)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    items = dataset(n)
+    for name, spec in [('MASTER_SHEETS', MASTER_SHEETS), ('GTD_SHEETS', GTD_SHEETS)]:
+        elapsed = run(items, spec)
+        print(f"📊 {name}: {n:,} items into {len(spec)} sheets in {elapsed * 1000:.0f} ms "
+              f"({n / elapsed:,.0f} items/sec)")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""GTD Voice App - cold start benchmark
+
+Starts fresh interpreters that import the server, build the app and serve the first
+page, and fails if the median start takes longer than the budget.
+
+Usage: python benchmarks/bench_startup.py [runs] [budget_ms]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WEBAPP = os.path.join(ROOT, 'webapp')
+
+# Median cold start allowed, import through first response
+STARTUP_BUDGET_MS = 500
+
+CHILD = '''
+import json, time
+start = time.perf_counter()
+import server
+imported = time.perf_counter()
+app = server.create_app()
+created = time.perf_counter()
+app.test_client().get('/')
+served = time.perf_counter()
+print(json.dumps({'import': imported - start, 'create_app': created - imported,
+                  'first_request': served - created, 'total': served - start}))
+'''
+
+
+def cold_start():
+    """Phase timings (ms) of one start in a new interpreter"""
+    out = subprocess.run([sys.executable, '-c', CHILD], cwd=WEBAPP, check=True,
+                         capture_output=True, text=True).stdout
+    return {phase: seconds * 1000 for phase, seconds in json.loads(out.splitlines()[-1]).items()}
+
+
+def slowest_imports(n=8):
+    """Top-level modules imported by the server, slowest first: [(ms, name)]"""
+    err = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import server'], cwd=WEBAPP,
+                         check=True, capture_output=True, text=True).stderr
+    children = []
+    for line in err.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = len(name) - len(name.lstrip())
+        if depth == 1:  # a top-level import; the lines before it were its children
+            if name.strip() == 'server':
+                return sorted(children, reverse=True)[:n]
+            children = []
+        elif depth == 3:
+            children.append((int(cumulative) / 1000, name.strip()))
+    return []
+
+
+def run(runs=10):
+    """Median of each phase over several cold starts"""
+    starts = [cold_start() for _ in range(runs)]
+    return {phase: statistics.median(s[phase] for s in starts) for phase in starts[0]}
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else STARTUP_BUDGET_MS
+    result = run(runs)
+    print(f"🚀 Cold start, median of {runs}: "
+          + ', '.join(f"{phase} {ms:.0f} ms" for phase, ms in result.items()))
+    if result['total'] > budget:
+        print(f"❌ Over the {budget:g} ms budget. Slowest imports:")
+        for ms, name in slowest_imports():
+            print(f"   {ms:7.1f} ms  {name}")
+        sys.exit(1)
+    print(f"✅ Within the {budget:g} ms budget")
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""GTD Voice App - benchmark suite
+
+Times the voice parser, every /api route (through the Flask test client, against a
+scratch store seeded with synthetic items) and both Excel layouts at several list
+sizes. Each benchmark reports p50 / p99 latency, throughput and peak traced memory;
+the results are written as JSON so runs on different commits can be compared.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 1000,10000,100000] [--storage sqlite|json]
+                                     [--snapshot json|compact] [--seconds 2] [--output results.json]
+    python benchmarks/bench_suite.py --compare old.json new.json [--threshold 1.2]
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WEBAPP = os.path.join(ROOT, 'webapp')
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, WEBAPP)
+
+from datasets import synthetic_items, utterances
+
+SIZES = [1000, 10000, 100000]
+CORPUS_SIZE = 1000
+
+# Time spent sampling each benchmark (at least MIN_SAMPLES, at most MAX_SAMPLES runs)
+SECONDS = 2.0
+MIN_SAMPLES = 3
+MAX_SAMPLES = 2000
+
+# Benchmarks slower than this (p50) skip the extra traced run: tracemalloc slows
+# allocation-heavy code like openpyxl several times over
+MEMORY_MAX_SECONDS = 1.0
+
+# Write benchmarks stop after touching this share of the list, so it stays near its
+# nominal size (and deletes don't run out of items)
+WRITE_SHARE = 0.1
+
+SEARCH_QUERIES = ['hpe', 'review', 'business plan', 'ananya', 'skills framework', 'call']
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list"""
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+class Runner:
+    """Samples benchmarks for one list size and collects their results"""
+
+    def __init__(self, size, seconds=SECONDS):
+        self.size = size
+        self.seconds = seconds
+        self.results = []
+
+    def measure(self, name, fn, setup=None, min_samples=MIN_SAMPLES, max_samples=MAX_SAMPLES,
+                warmup=True, memory=True):
+        """Time fn(i) for samples i = 0, 1, ...; setup(i), if given, runs untimed before each"""
+        if warmup:
+            if setup:
+                setup(-1)
+            fn(-1)
+        times = []
+        deadline = time.perf_counter() + self.seconds
+        while len(times) < min_samples or (time.perf_counter() < deadline and len(times) < max_samples):
+            i = len(times)
+            if setup:
+                setup(i)
+            start = time.perf_counter()
+            fn(i)
+            times.append(time.perf_counter() - start)
+        times.sort()
+
+        peak = None
+        if memory and times[len(times) // 2] <= MEMORY_MAX_SECONDS:
+            i = len(times)
+            if setup:
+                setup(i)
+            tracemalloc.start()
+            fn(i)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        result = {
+            'name': name,
+            'size': self.size,
+            'samples': len(times),
+            'p50_ms': round(percentile(times, 50) * 1000, 4),
+            'p99_ms': round(percentile(times, 99) * 1000, 4),
+            'mean_ms': round(sum(times) / len(times) * 1000, 4),
+            'ops_per_sec': round(len(times) / sum(times), 2),
+            'peak_kib': None if peak is None else round(peak / 1024, 1),
+        }
+        self.results.append(result)
+        peak_text = '-' if peak is None else f"{result['peak_kib']:,.0f} KiB"
+        print(f"   {name:<44} p50 {result['p50_ms']:10.3f} ms  p99 {result['p99_ms']:10.3f} ms  "
+              f"{result['ops_per_sec']:>11,.1f}/s  peak {peak_text}", file=sys.stderr)
+        return result
+
+
+def check(response, status=200):
+    response.get_data()  # drain streamed bodies, so generating them is timed too
+    if response.status_code != status:
+        raise RuntimeError(f"{response.request.method} {response.request.path}: "
+                           f"{response.status_code} {response.get_data(as_text=True)[:200]}")
+    return response
+
+
+def bench_size(size, seconds):
+    """All benchmarks for one list size (runs in its own process, see main)"""
+    import snapshot
+    items = synthetic_items(size)
+    with open(os.path.join(os.environ['GTD_DATA_DIR'], 'gtd_data.json'), 'wb') as f:
+        f.write(snapshot.dumps(items, os.environ.get('GTD_SNAPSHOT_FORMAT', 'json')))
+
+    import server
+    from gtd_workbook import GTD_SHEETS, MASTER_SHEETS, build_workbook
+    from voice_parser import parse_voice_input
+
+    run = Runner(size, seconds)
+    corpus = utterances(CORPUS_SIZE)
+    client = server.create_app().test_client()
+    text = lambda i: corpus[i % len(corpus)]
+
+    run.measure('store: open and seed', lambda i: server.get_store(), min_samples=1, max_samples=1,
+                warmup=False, memory=False)
+    run.measure('parse_voice_input', lambda i: parse_voice_input(text(i)))
+
+    # Reads
+    run.measure('GET /', lambda i: check(client.get('/')))
+    run.measure('GET /api/items', lambda i: check(client.get('/api/items')))
+    etag = client.get('/api/items').headers['ETag']
+    run.measure('GET /api/items (304)',
+                lambda i: check(client.get('/api/items', headers={'If-None-Match': etag}), 304))
+    run.measure('GET /api/items?status&sort=priority',
+                lambda i: check(client.get('/api/items?status=Next+Action&sort=priority&limit=50')))
+    run.measure('GET /api/items?sort=due&cursor',
+                lambda i: check(client.get('/api/items?sort=due&limit=50')))
+    run.measure('GET /api/items/by-id/<id>',
+                lambda i: check(client.get(f'/api/items/by-id/{i % size + 1}')))
+    run.measure('GET /api/search',
+                lambda i: check(client.get(f'/api/search?q={SEARCH_QUERIES[i % len(SEARCH_QUERIES)]}')))
+    run.measure('GET /api/stats', lambda i: check(client.get('/api/stats')))
+    run.measure('POST /api/parse', lambda i: check(client.post('/api/parse', json={'text': text(i)})))
+    run.measure('POST /api/parse/batch (50)', lambda i: check(client.post(
+        '/api/parse/batch', json={'texts': [text(i * 50 + n) for n in range(50)]})))
+
+    # Writes (each one also invalidates the derived indexes)
+    writes = max(MIN_SAMPLES, int(size * WRITE_SHARE))
+    run.measure('POST /api/items', lambda i: check(client.post('/api/items', json={'item': text(i)})),
+                max_samples=writes)
+    run.measure('POST /api/items/batch (20)', lambda i: check(client.post(
+        '/api/items/batch', json={'texts': [f"Add {text(i * 20 + n)}" for n in range(20)]})),
+        max_samples=max(MIN_SAMPLES, writes // 20))
+    run.measure('PUT /api/items/by-id/<id>', lambda i: check(client.put(
+        f'/api/items/by-id/{i % size + 1}', json={'notes': f'benchmark edit {i}'})), max_samples=writes)
+    run.measure('PUT /api/items/<index>', lambda i: check(client.put(
+        f'/api/items/{i % size}', json={'notes': f'benchmark edit {i}'})), max_samples=writes)
+    run.measure('POST /api/items/by-id/<id>/complete',
+                lambda i: check(client.post(f'/api/items/by-id/{i + 2}/complete')), max_samples=writes)
+    run.measure('DELETE /api/items/by-id/<id>',
+                lambda i: check(client.delete(f'/api/items/by-id/{size - 1 - i}')), max_samples=writes)
+    edit = lambda i: check(client.put('/api/items/by-id/1', json={'notes': f'edit before read {i}'}))
+    run.measure('GET /api/items (after a write)', lambda i: check(client.get('/api/items')), setup=edit,
+                max_samples=writes)
+    run.measure('GET /api/search (after a write)',
+                lambda i: check(client.get('/api/search?q=review')), setup=edit, max_samples=writes)
+
+    # Exports
+    run.measure('GET /api/export?format=csv', lambda i: check(client.get('/api/export?format=csv')),
+                min_samples=1)
+    run.measure('GET /api/export (xlsx)', lambda i: check(client.get('/api/export')), min_samples=1)
+
+    def export_job(i):
+        job = check(client.post('/api/export'), 202).get_json()['job']
+        while job['status'] not in ('done', 'failed'):
+            time.sleep(0.005)
+            job = check(client.get(f"/api/export/jobs/{job['id']}")).get_json()
+        check(client.get(f"/api/export/jobs/{job['id']}/download"))
+
+    run.measure('POST /api/export (job, full build)', export_job, min_samples=1, max_samples=1,
+                warmup=False, memory=False)
+    run.measure('POST /api/export (job, after a write)', export_job, setup=edit, min_samples=1, warmup=False)
+    run.measure('POST /api/export (job, unchanged)', export_job)
+
+    # Excel generators (create_excel.py / create_gtd_excel.py layouts), build and save
+    items = server.get_store().all()
+    with tempfile.TemporaryDirectory() as out:
+        for name, spec in [('MASTER_SHEETS', MASTER_SHEETS), ('GTD_SHEETS', GTD_SHEETS)]:
+            run.measure(f'workbook {name}', lambda i: build_workbook(items, spec).save(
+                os.path.join(out, f'{name}.xlsx')), min_samples=1, warmup=False)
+
+    return {
+        'size': size,
+        'max_rss_kib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'results': run.results,
+    }
+
+
+def run_size(size, storage, snapshot_format, seconds):
+    """bench_size in a fresh interpreter with its own scratch data directory"""
+    with tempfile.TemporaryDirectory(prefix='gtd-bench-') as data_dir:
+        env = dict(os.environ, GTD_DATA_DIR=data_dir, GTD_STORAGE=storage, GTD_SNAPSHOT_FORMAT=snapshot_format)
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', str(size),
+                              '--seconds', str(seconds)], cwd=WEBAPP, env=env, check=True,
+                             stdout=subprocess.PIPE, text=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old_path, new_path, threshold):
+    """Print p50 changes between two result files; returns the number of regressions"""
+    with open(old_path) as f:
+        old = {(r['size'], r['name']): r for run in json.load(f)['runs'] for r in run['results']}
+    with open(new_path) as f:
+        new = [r for run in json.load(f)['runs'] for r in run['results']]
+    regressions = 0
+    for r in new:
+        before = old.get((r['size'], r['name']))
+        if not before or not before['p50_ms']:
+            continue
+        ratio = r['p50_ms'] / before['p50_ms']
+        flag = '  '
+        if ratio >= threshold:
+            flag = '⚠️'
+            regressions += 1
+        print(f"{flag} {r['size']:>7,} {r['name']:<44} {before['p50_ms']:10.3f} → {r['p50_ms']:10.3f} ms"
+              f"  ({ratio:.2f}x)")
+    print(f"\n{regressions} regression(s) at ≥{threshold:g}x p50")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)),
+                        help='comma-separated item counts (default: %(default)s)')
+    parser.add_argument('--storage', default=os.environ.get('GTD_STORAGE', 'sqlite'), choices=['sqlite', 'json'])
+    parser.add_argument('--snapshot', default=os.environ.get('GTD_SNAPSHOT_FORMAT', 'json'), choices=['json', 'compact'],
+                        help='format of the seeded gtd_data.json snapshot')
+    parser.add_argument('--seconds', type=float, default=SECONDS, help='sampling time per benchmark')
+    parser.add_argument('--output', help='result file (default: benchmarks/results/<commit>-<time>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two result files')
+    parser.add_argument('--threshold', type=float, default=1.2, help='p50 ratio reported as a regression')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+    if args.worker:
+        print(json.dumps(bench_size(args.worker, args.seconds)))
+        return
+
+    commit = git_commit()
+    started = datetime.datetime.now()
+    report = {
+        'commit': commit,
+        'started': started.isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'storage': args.storage,
+        'snapshot': args.snapshot,
+        'runs': [],
+    }
+    for size in map(int, args.sizes.split(',')):
+        print(f"📏 {size:,} items ({args.storage}, {args.snapshot} snapshot)", file=sys.stderr)
+        report['runs'].append(run_size(size, args.storage, args.snapshot, args.seconds))
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{commit or 'nogit'}-{started:%Y%m%d-%H%M%S}.json")
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Results written to {output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""GTD Voice App - synthetic benchmark data
+
+Items follow the gtd_items schema, with every field drawn from the values (and
+frequencies) of the seed list, so filters, groups and sheets stay realistically
+selective at any size. Everything is seeded and reproducible.
+"""
+
+import datetime
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from gtd_data import gtd_items
+
+FIELDS = ['item', 'category', 'project', 'context', 'next_action', 'waiting_for', 'someday',
+          'priority', 'status', 'energy', 'time', 'due', 'delegated', 'notes']
+
+# Share of synthetic items with a YYYY-MM-DD due date
+DATED_SHARE = 0.3
+
+VERBS = ['Call', 'Email', 'Review', 'Draft', 'Buy', 'Schedule', 'Think about', 'Read', 'Book',
+         'Follow up on', 'Prepare', 'Fix', 'Plan', 'Update', 'Complete', 'Delete', 'Waiting for']
+OBJECTS = ['the HPE clearbook deck', 'Riyadh Air safety storyboard', 'World Bank skills framework',
+           'AstraZeneca webinar tour', 'BAT onboarding module', 'CAA audit checklist',
+           'business plan outline', 'quarterly invoices', 'groceries', 'doctor appointment for dad',
+           'birthday gift for Ananya', 'car service', 'prompt engineering notes', 'team offsite agenda',
+           'client proposal', 'laptop backups', 'gym membership', 'tax documents']
+QUALIFIERS = ['', '- high priority', ', urgent', 'when possible', 'on the way home', 'on my computer',
+              'this weekend', '- critical', 'someday maybe', 'every week', 'monthly', 'at the office']
+
+
+def synthetic_items(n, seed=0):
+    """n items with ids 1..n in the gtd_items schema"""
+    rng = random.Random(seed)
+    titles = [item['item'] for item in gtd_items]
+    start = datetime.date(2026, 1, 1)
+    items = []
+    for item_id in range(1, n + 1):
+        item = {field: rng.choice(gtd_items).get(field, '') for field in FIELDS}
+        item['item'] = f"{rng.choice(titles)} #{item_id}"
+        if rng.random() < DATED_SHARE:
+            item['due'] = (start + datetime.timedelta(days=rng.randrange(365))).isoformat()
+        item['id'] = item_id
+        items.append(item)
+    return items
+
+
+def utterances(n, seed=0):
+    """n dictated commands: the seed titles, then generated verb / object / qualifier phrases"""
+    rng = random.Random(seed)
+    texts = [item['item'] for item in gtd_items][:n]
+    while len(texts) < n:
+        texts.append(' '.join(filter(None, [rng.choice(VERBS), rng.choice(OBJECTS), rng.choice(QUALIFIERS)])))
+    return texts
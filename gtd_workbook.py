@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""GTD Workbook Builder - formatted Excel workbooks from GTD items
+
+A workbook is described by a spec: a list of sheets, each a dict with a 'kind'
+('table', 'groups' or 'legend') and its layout. build_workbook(items, spec) renders
+it. Cell formats are named styles, registered once per workbook and shared by every
+cell that uses them, instead of fresh Font / PatternFill / Alignment objects per cell.
+
+MASTER_SHEETS is the 15-sheet layout written by create_excel.py (and the web app's
+export), GTD_SHEETS the 16-sheet layout written by create_gtd_excel.py.
+"""
+
+import datetime
+import hashlib
+import re
+import zipfile
+
+from openpyxl import Workbook
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.writer.excel import ExcelWriter
+
+# Item fields, in column order
+FIELDS = ['item', 'category', 'project', 'context', 'next_action', 'waiting_for', 'someday',
+          'priority', 'status', 'energy', 'time', 'due', 'delegated', 'notes']
+
+HEADERS = ['Item', 'Category', 'Project/Area', 'Context', 'Next Action', 'Waiting For', 'Someday/Maybe',
+           'Priority', 'Status', 'Energy', 'Time Required', 'Due Date', 'Delegated To', 'Notes']
+
+# Column header -> item field, including the CSV's spelling
+HEADER_FIELDS = {**dict(zip(HEADERS, FIELDS)), 'Energy Level': 'energy'}
+
+FONT = 'Aptos'
+THIN = Side(style='thin', color='CCCCCC')
+BORDER = Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
+ALIGNMENTS = {
+    'center': Alignment(horizontal='center', vertical='center', wrap_text=True),
+    'wrap': Alignment(vertical='center', wrap_text=True),
+}
+
+
+def style(size=10, bold=False, color=None, fill=None, border=False, align=None):
+    """A cell format; build_workbook registers each distinct one as a named style"""
+    return (size, bold, color, fill, border, align)
+
+
+def cell(fill=None, bold=False, color=None):
+    """Format of a bordered, wrapped table cell"""
+    return style(bold=bold, color=color, fill=fill, border=True, align='wrap')
+
+
+def header(fill):
+    return style(11, True, 'FFFFFF', fill, True, 'center')
+
+
+TEXT = style()
+BOLD = style(bold=True)
+BODY = cell()
+BORDERED = style(border=True)
+SUBHEADER = style(bold=True, fill='EEEEEE', border=True)
+
+
+def contains(pattern, case=False):
+    """Condition matching a regex anywhere in the field (like pandas str.contains)"""
+    return re.compile(pattern, 0 if case else re.IGNORECASE)
+
+
+def _text(item, field):
+    value = item.get(field)
+    return '' if value is None else value
+
+
+def _test(condition):
+    """Test of a single field value against a where condition"""
+    if isinstance(condition, re.Pattern):
+        return lambda value: condition.search(str(value)) is not None
+    if isinstance(condition, (list, tuple, set)):
+        values = set(condition)
+        return lambda value: value in values
+    return lambda value: value == condition
+
+
+def matcher(where):
+    """Predicate for items matching every condition in where"""
+    tests = [(field, _test(condition)) for field, condition in (where or {}).items()]
+    return lambda item: all(test(_text(item, field)) for field, test in tests)
+
+
+def select(items, where=None, limit=None):
+    """Items matching every condition in where ({field: value | [values] | contains(...)})"""
+    rows = list(filter(matcher(where), items))
+    return rows[:limit] if limit is not None else rows
+
+
+def _sections(sheet):
+    """(label, where, limit) of each filtered section of a sheet"""
+    if sheet['kind'] == 'table':
+        return [(None, sheet.get('where'), sheet.get('limit'))]
+    return [(g[0], g[1], g[2] if len(g) > 2 else None) for g in sheet.get('groups') or ()]
+
+
+def partition(items, spec):
+    """Rows of every sheet, from a single pass over the items
+
+    Returns one list of (label, rows) sections per sheet. Conditions are evaluated
+    once per distinct field value and remembered, and group_by sheets are served from
+    a value -> items index built in the same pass, so the cost grows with the number
+    of items (plus rows written), not items x sheets.
+    """
+    routes = []      # [rows, limit, number of conditions] per filtered section
+    tests = {}       # field -> [(route, test)]
+    everything = []  # routes without conditions
+    for sheet in spec:
+        for _, where, limit in _sections(sheet):
+            route = len(routes)
+            routes.append([[], limit, len(where or {})])
+            if not where:
+                everything.append(route)
+            for field, condition in (where or {}).items():
+                tests.setdefault(field, []).append((route, _test(condition)))
+    known = {field: {} for field in tests}  # field -> value -> routes it satisfies
+    index = {sheet['group_by']: {} for sheet in spec if 'group_by' in sheet}
+
+    def take(route, item):
+        rows, limit, _ = routes[route]
+        if limit is None or len(rows) < limit:
+            rows.append(item)
+
+    for item in items:
+        partial = {}
+        for field, field_tests in tests.items():
+            value = _text(item, field)
+            matched = known[field].get(value)
+            if matched is None:
+                matched = known[field][value] = [route for route, test in field_tests if test(value)]
+            for route in matched:
+                if routes[route][2] == 1:
+                    take(route, item)
+                else:
+                    partial[route] = partial.get(route, 0) + 1
+        for route, hits in partial.items():
+            if hits == routes[route][2]:
+                take(route, item)
+        for route in everything:
+            take(route, item)
+        for field, groups in index.items():
+            groups.setdefault(_text(item, field), []).append(item)
+
+    result = []
+    route = 0
+    for sheet in spec:
+        if 'group_by' in sheet:
+            groups = index[sheet['group_by']]
+            result.append([(value, groups[value]) for value in sorted(groups) if value != ''])
+            continue
+        sections = []
+        for label, _, _ in _sections(sheet):
+            sections.append((label, routes[route][0]))
+            route += 1
+        result.append(sections)
+    return result
+
+
+class Styles:
+    """Named styles of one workbook, each registered the first time it's used"""
+
+    def __init__(self, wb):
+        self.wb = wb
+        self.names = {}
+
+    def __getitem__(self, spec):
+        name = self.names.get(spec)
+        if name is None:
+            size, bold, color, fill, border, align = spec
+            name = f'GTD {len(self.names) + 1}'
+            named = NamedStyle(name=name, font=Font(name=FONT, size=size, bold=bold, color=color))
+            if fill:
+                named.fill = PatternFill(start_color=fill, end_color=fill, fill_type='solid')
+            if border:
+                named.border = BORDER
+            if align:
+                named.alignment = ALIGNMENTS[align]
+            self.wb.add_named_style(named)
+            self.names[spec] = name
+        return name
+
+    def put(self, ws, row, column, value, spec):
+        ws.cell(row=row, column=column, value=value).style = self[spec]
+
+
+def _widths(ws, widths):
+    for col, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+
+def _title(ws, sheet, styles):
+    """Sheet title in A1; returns the first free row below it"""
+    if not sheet.get('title'):
+        return 1
+    styles.put(ws, 1, 1, sheet['title'], style(sheet.get('title_size', 14), True))
+    if sheet.get('title_merge'):
+        ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=sheet['title_merge'])
+    return 3
+
+
+def table_sheet(ws, sections, sheet, styles):
+    """Filtered list with a colored header row, per-value cell colors, filters and frozen header"""
+    columns = sheet['columns']
+    [(_, rows)] = sections
+    for col, (title, _) in enumerate(columns, 1):
+        styles.put(ws, 1, col, title, header(sheet.get('header_fill', '2C3E50')))
+    colors = sheet.get('colors', {})
+    for row, item in enumerate(rows, 2):
+        for col, (_, field) in enumerate(columns, 1):
+            value = _text(item, field)
+            spec = colors.get(field)
+            if spec is not None:
+                spec = spec(value) if callable(spec) else spec.get(value)
+            styles.put(ws, row, col, value, spec or BODY)
+    _widths(ws, sheet['widths'])
+    ws.freeze_panes = 'A2'
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(columns))}{len(rows) + 1}"
+    if sheet.get('header_height'):
+        ws.row_dimensions[1].height = sheet['header_height']
+
+
+def groups_sheet(ws, sections, sheet, styles):
+    """Titled sections of items, each with an optional banner and column header row"""
+    columns = sheet['columns']
+    row = _title(ws, sheet, styles)
+    banner = sheet.get('banner')
+    highlight = sheet.get('highlight')
+    highlighted = highlight and matcher(highlight[0])
+    for label, group in sections:
+        if not group and sheet.get('skip_empty', True):
+            continue
+        if banner:
+            styles.put(ws, row, 1, label, banner)
+            if sheet.get('banner_merge', True):
+                ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=len(columns))
+            row += 1
+        if sheet.get('header'):
+            for col, (title, *_) in enumerate(columns, 1):
+                styles.put(ws, row, col, title, sheet['header'])
+            row += 1
+        for item in group:
+            spec = highlight[1] if highlight and highlighted(item) else sheet.get('row', BORDERED)
+            for col, (_, field, *fmt) in enumerate(columns, 1):
+                value = _text(item, field)
+                styles.put(ws, row, col, fmt[0].format(value) if fmt else value, spec)
+            row += 1
+        row += 1
+    _widths(ws, sheet['widths'])
+
+
+def legend_sheet(ws, sections, sheet, styles):
+    """Static reference blocks: a heading, then (label, fill, description) lines"""
+    row = _title(ws, sheet, styles)
+    for block in sheet['blocks']:
+        styles.put(ws, row, 1, block['heading'], style(12, True))
+        row += 1
+        for label, fill, description in block['entries']:
+            styles.put(ws, row, 1, label, style(fill=fill, border=block.get('border', False)))
+            if description:
+                styles.put(ws, row, 2, description, TEXT)
+            row += 1
+        row += block.get('gap', 1)
+    _widths(ws, sheet['widths'])
+
+
+SHEET_KINDS = {
+    'table': table_sheet,
+    'groups': groups_sheet,
+    'legend': legend_sheet,
+}
+
+
+def sheet_hash(sheet, sections):
+    """Digest of everything a sheet shows: its section labels and the values of its rows"""
+    fields = [column[1] for column in sheet.get('columns', ())]
+    fields += list((sheet.get('highlight') or ({},))[0])
+    digest = hashlib.sha1()
+    for label, rows in sections:
+        digest.update(repr((label, len(rows))).encode())
+        for item in rows:
+            digest.update(repr([_text(item, field) for field in fields]).encode())
+    return digest.hexdigest()
+
+
+class _PartsWriter(ExcelWriter):
+    """ExcelWriter that reuses the XML of worksheets saved before, from parts[position]
+
+    Strings are written inline and style ids only ever grow, so a sheet's XML depends
+    on nothing but its own cells. Our layouts have no charts, images or comments.
+    """
+
+    def __init__(self, workbook, archive, parts):
+        super().__init__(workbook, archive)
+        self.parts = parts
+
+    def write_worksheet(self, ws):
+        ws._drawing = SpreadsheetDrawing()
+        n = ws._id - 1
+        if self.parts[n] is None:
+            writer = WorksheetWriter(ws)
+            writer.write()
+            ws._rels = writer._rels
+            with open(writer.out, 'rb') as f:
+                self.parts[n] = f.read()
+            writer.cleanup()
+        self._archive.writestr(ws.path[1:], self.parts[n])
+        self.manifest.append(ws)
+
+
+class CachedWorkbook(Workbook):
+    """Workbook whose save() skips serializing the sheets WorkbookCache didn't re-render"""
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []  # serialized XML per sheet position, None once re-rendered
+
+    def save(self, filename):
+        with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            self.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+            _PartsWriter(self, archive, self.parts).write_data()
+
+
+class WorkbookCache:
+    """Keeps the last rendered workbook and re-renders only the sheets whose rows changed
+
+    build() hashes every sheet's content and replaces just the sheets whose hash differs
+    from the previous build; the rest are reused as they are, and saving writes out the
+    XML they were serialized to last time. It returns the same Workbook object each
+    time, so save it before building again, and don't share one cache between threads.
+
+    Every change touches 'GTD Master List', which holds all the items, so an edit still
+    re-renders and re-serializes that sheet (about half the cost of a full export).
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.wb = None
+        self.styles = None
+        self.hashes = [None] * len(spec)
+        self.rebuilt = []  # titles of the sheets rendered by the last build
+
+    def build(self, items, progress=None):
+        """The workbook for items; progress(done, total) is called as each sheet is finished"""
+        if self.wb is None:
+            self.wb = CachedWorkbook()
+            self.wb.remove(self.wb.active)
+            self.wb.parts = [None] * len(self.spec)
+            self.styles = Styles(self.wb)
+        self.rebuilt = []
+        for n, (sheet, sections) in enumerate(zip(self.spec, partition(items, self.spec))):
+            digest = sheet_hash(sheet, sections)
+            if digest != self.hashes[n]:
+                if n < len(self.wb.worksheets):
+                    self.wb.remove(self.wb.worksheets[n])
+                ws = self.wb.create_sheet(sheet['title_sheet'], n)
+                SHEET_KINDS[sheet['kind']](ws, sections, sheet, self.styles)
+                self.hashes[n] = digest
+                self.wb.parts[n] = None
+                self.rebuilt.append(sheet['title_sheet'])
+            if progress:
+                progress(n + 1, len(self.spec))
+        self.wb.active = 0
+        return self.wb
+
+
+def build_workbook(items, spec, progress=None):
+    """Render a workbook spec for a list of items
+
+    progress(done, total) is called as each sheet is finished.
+    """
+    return WorkbookCache(spec).build(items, progress)
+
+
+# --- create_excel.py layout ---
+
+MASTER_COLUMNS = list(zip(HEADERS, FIELDS))
+MASTER_WIDTHS = [50, 12, 28, 12, 45, 25, 5, 10, 18, 10, 12, 10, 12, 40]
+
+MASTER_COLORS = {
+    'priority': {
+        'Critical': cell('FF6B6B', True, 'FFFFFF'),
+        'High': cell('FFA94D', True, '000000'),
+        'Medium': cell('FFD93D', True, '000000'),
+        'Low': cell('6BCB77', True, '000000'),
+    },
+    'status': {status: cell(fill) for status, fill in {
+        'Next Action': 'FF6B6B', 'Project': '4ECDC4', 'Waiting For': 'A8E6CF', 'Someday/Maybe': 'DDA0DD',
+        'Recurring - Daily': 'FFB6C1', 'Recurring - Weekly': 'E6E6FA', 'Recurring - Monthly': 'B0E0E6',
+        'Recurring - Quarterly': 'F0E68C', 'Ongoing': '87CEEB', 'As Needed': 'F5DEB3', 'Reference': 'D3D3D3',
+    }.items()},
+    'category': {
+        'Professional': cell('4A90A4', color='FFFFFF'),
+        'Personal': cell('9B59B6', color='FFFFFF'),
+    },
+}
+
+
+def master_table(title, header_fill='2C3E50', where=None):
+    return {'kind': 'table', 'title_sheet': title, 'header_fill': header_fill, 'where': where,
+            'columns': MASTER_COLUMNS, 'widths': MASTER_WIDTHS, 'colors': MASTER_COLORS}
+
+
+MASTER_SHEETS = [
+    master_table('GTD Master List'),
+    master_table('Next Actions', 'FF6B6B', {'status': 'Next Action'}),
+    master_table('Projects', '4ECDC4', {'status': 'Project'}),
+    master_table('Waiting For', 'A8E6CF', {'status': 'Waiting For'}),
+    master_table('Someday-Maybe', 'DDA0DD', {'status': 'Someday/Maybe'}),
+    master_table('Recurring Tasks', 'E6E6FA', {'status': contains('Recurring', case=True)}),
+    master_table('High Priority', 'FF6B6B', {'priority': ['Critical', 'High']}),
+    master_table('Professional', '4A90A4', {'category': 'Professional'}),
+    master_table('Personal', '9B59B6', {'category': 'Personal'}),
+    master_table('AI Skills - CORE', 'FF6B6B', {'project': contains('AI')}),
+    master_table('Strategic Accounts', '4A90A4',
+                 {'project': contains('World Bank|HPE|CAA|BAT|Riyadh Air|AstraZeneca')}),
+    master_table('Business Planning', '2C3E50',
+                 {'project': contains('Business|Professional Identity|Personal Projects')}),
+    master_table('Family & Health', '9B59B6', {'project': contains('Family|Health|Mindfulness')}),
+    {
+        'kind': 'groups', 'title_sheet': 'Weekly Review',
+        'title': 'WEEKLY REVIEW - Shreyas GTD', 'title_size': 16, 'title_merge': 4,
+        'groups': [
+            ('🔴 CRITICAL - Address This Week', {'priority': 'Critical'}),
+            ('🟠 HIGH PRIORITY', {'priority': 'High'}, 15),
+            ('⏳ WAITING FOR - Follow Up', {'status': 'Waiting For'}),
+            ('🤖 AI SKILLS - Daily Practice', {'project': contains('AI Skills')}),
+            ('🔄 RECURRING - Weekly', {'status': 'Recurring - Weekly'}),
+        ],
+        'banner': style(12, True), 'banner_merge': False, 'row': TEXT,
+        'columns': [('Item', 'item', '□ {}'), ('Project/Area', 'project'), ('Next Action', 'next_action')],
+        'widths': [50, 25, 45],
+    },
+    {
+        'kind': 'legend', 'title_sheet': 'Legend',
+        'blocks': [
+            {'heading': 'Priority Colors:', 'entries': [
+                ('Critical', 'FF6B6B', None), ('High', 'FFA94D', None),
+                ('Medium', 'FFD93D', None), ('Low', '6BCB77', None)]},
+            {'heading': 'Status Colors:', 'entries': [
+                ('Next Action', 'FF6B6B', None), ('Project', '4ECDC4', None), ('Waiting For', 'A8E6CF', None),
+                ('Someday/Maybe', 'DDA0DD', None), ('Recurring', 'E6E6FA', None)]},
+            {'heading': 'Contexts:', 'entries': [
+                (context, None, None) for context in
+                ['@Computer', '@Phone', '@Office', '@Home', '@Thinking', '@Errands', '@Anywhere']]},
+        ],
+        'widths': [25],
+    },
+]
+
+
+# --- create_gtd_excel.py layout ---
+
+GTD_COLUMNS = [('Energy Level' if field == 'energy' else title, field) for title, field in MASTER_COLUMNS]
+GTD_WIDTHS = [55, 12, 30, 12, 50, 35, 5, 10, 18, 10, 12, 12, 15, 50]
+
+GTD_PRIORITY_COLORS = {
+    'Critical': cell('FF6B6B', True, 'FFFFFF'),
+    'High': cell('FFA94D', True),
+    'Medium': cell('FFD93D'),
+    'Low': cell('6BCB77'),
+}
+
+GTD_COLORS = {
+    'category': MASTER_COLORS['category'],
+    'priority': GTD_PRIORITY_COLORS,
+    'status': {status: cell(fill, color=font) for status, (fill, font) in {
+        'Next Action': ('FF6B6B', 'FFFFFF'), 'Project': ('4ECDC4', 'FFFFFF'),
+        'Waiting For': ('A8E6CF', '000000'), 'Someday/Maybe': ('DDA0DD', '000000'),
+        'Recurring - Daily': ('FFB6C1', '000000'), 'Recurring - Weekly': ('E6E6FA', '000000'),
+        'Recurring - Monthly': ('B0E0E6', '000000'), 'Recurring - Quarterly': ('F0E68C', '000000'),
+        'Recurring - Yearly': ('DEB887', '000000'), 'Ongoing': ('87CEEB', '000000'),
+        'As Needed': ('F5DEB3', '000000'), 'Reference': ('D3D3D3', '000000'),
+    }.items()},
+}
+
+RECURRENCE_FILLS = [('Daily', 'FFB6C1'), ('Weekly', 'E6E6FA'), ('Monthly', 'B0E0E6'),
+                    ('Quarterly', 'F0E68C'), ('Yearly', 'DEB887')]
+
+
+def recurrence_cell(status):
+    """Status cell colored by how often the task recurs"""
+    for word, fill in RECURRENCE_FILLS:
+        if word in str(status):
+            return cell(fill)
+    return None
+
+
+def gtd_table(title, header_fill, where=None, colors=None):
+    return {'kind': 'table', 'title_sheet': title, 'header_fill': header_fill, 'where': where,
+            'columns': GTD_COLUMNS, 'widths': GTD_WIDTHS, 'colors': colors or {}}
+
+
+def gtd_groups(title, sheet_title, groups, banner_fill, columns, widths):
+    return {'kind': 'groups', 'title_sheet': sheet_title, 'title': title, 'groups': groups,
+            'banner': style(12, True, 'FFFFFF', banner_fill), 'header': SUBHEADER,
+            'columns': columns, 'widths': widths}
+
+
+GTD_SHEETS = [
+    {**gtd_table('GTD Master List', '2C3E50', colors=GTD_COLORS), 'header_height': 25},
+    gtd_table('Next Actions', 'FF6B6B', {'status': 'Next Action'}),
+    gtd_table('Projects', '4ECDC4', {'status': 'Project'}),
+    gtd_table('Waiting For', 'A8E6CF', {'status': 'Waiting For'}),
+    gtd_table('Someday-Maybe', 'DDA0DD', {'status': 'Someday/Maybe'}),
+    gtd_table('Recurring Tasks', 'E6E6FA', {'status': contains('Recurring', case=True)},
+              {'status': recurrence_cell}),
+    gtd_table('Professional', '4A90A4', {'category': 'Professional'}),
+    gtd_table('Personal', '9B59B6', {'category': 'Personal'}),
+    gtd_table('High Priority', 'FF6B6B', {'priority': ['Critical', 'High']}, {'priority': GTD_PRIORITY_COLORS}),
+    {
+        **gtd_groups(None, 'By Context', None, '2C3E50',
+                     [('Item', 'item'), ('Project/Area', 'project'), ('Priority', 'priority'),
+                      ('Status', 'status'), ('Next Action', 'next_action')],
+                     [55, 30, 10, 18, 50]),
+        'group_by': 'context',
+    },
+    {
+        **gtd_groups('WEEKLY REVIEW - Shreyas GTD', 'Weekly Review', [
+            ('🔴 CRITICAL ITEMS - Address Immediately', {'priority': 'Critical'}),
+            ('🟠 HIGH PRIORITY - This Week', {'priority': 'High'}),
+            ('⏳ WAITING FOR - Follow Up', {'status': 'Waiting For'}),
+            ('📋 ACTIVE PROJECTS - Review Progress', {'status': 'Project'}),
+            ('🔄 RECURRING - Daily Tasks', {'status': 'Recurring - Daily'}),
+            ('🔄 RECURRING - Weekly Tasks', {'status': 'Recurring - Weekly'}),
+        ], None, [('Item', 'item'), ('Project/Area', 'project'), ('Next Action', 'next_action'),
+                  ('Status', 'status')], [55, 30, 50, 18]),
+        'banner': style(11, True),
+    },
+    gtd_groups('STRATEGIC ACCOUNT PORTFOLIO', 'Strategic Accounts', [
+        (f'📊 {account}', {'project': contains(account)})
+        for account in ['World Bank Group', 'HPE', 'CAA', 'BAT', 'Riyadh Air', 'AstraZeneca']
+    ], '4A90A4', [('Item', 'item'), ('Status', 'status'), ('Priority', 'priority'), ('Notes', 'notes')],
+        [55, 18, 10, 50]),
+    gtd_groups('ROLE DEVELOPMENT TASKS - Strategic Innovation Lead', 'Role Development', [
+        (f'🎯 {area}', {'project': contains(area)})
+        for area in ['AI Integration', 'Strategic Accounts', 'Innovation Lab', 'Presales-Delivery Bridge']
+    ], '2C3E50', [('Task', 'item'), ('Frequency', 'status'), ('Time Required', 'time'), ('Notes', 'notes')],
+        [55, 20, 15, 50]),
+    gtd_groups('FAMILY & LIFE PRIORITIES', 'Family & Life', [
+        (label, {'project': contains(area)}) for label, area in [
+            ('👨‍👩‍👧 Family - Partner (MMD)', 'Family - Partner'),
+            ('👶 Family - Children (Ananya)', 'Family - Children'),
+            ('👴👵 Family - Parents', 'Family - Parents'),
+            ('🏠 Home', 'Home'),
+            ('❤️ Health', 'Health'),
+            ('💰 Financial', 'Financial'),
+            ('🎯 Goals & Planning', 'Goals'),
+        ]
+    ], '9B59B6', [('Item', 'item'), ('Priority', 'priority'), ('Status', 'status'), ('Notes', 'notes')],
+        [55, 10, 18, 50]),
+    {
+        'kind': 'groups', 'title_sheet': 'Business Planning', 'title': '🚀 NEW BUSINESS PLANNING - Q1 2026 Goal',
+        'groups': [(None, {'project': contains(
+            'Business Planning|Personal Projects|Professional Identity|Personal Branding')})],
+        'skip_empty': False, 'header': style(bold=True, color='FFFFFF', fill='2C3E50', border=True),
+        'highlight': ({'priority': 'Critical'}, style(fill='FFE4E1', border=True)),
+        'columns': [('Item', 'item'), ('Project Area', 'project'), ('Priority', 'priority'),
+                    ('Status', 'status'), ('Next Action', 'next_action'), ('Notes', 'notes')],
+        'widths': [45, 20, 10, 15, 40, 35],
+    },
+    {
+        'kind': 'legend', 'title_sheet': 'Legend & Guide', 'title': 'GTD LEGEND & COLOR GUIDE',
+        'blocks': [
+            {'heading': 'PRIORITY COLORS', 'border': True, 'entries': [
+                ('Critical', 'FF6B6B', 'Urgent and important - address immediately'),
+                ('High', 'FFA94D', 'Important - complete this week'),
+                ('Medium', 'FFD93D', 'Significant - schedule appropriately'),
+                ('Low', '6BCB77', 'Nice to have - do when time permits'),
+            ]},
+            {'heading': 'STATUS COLORS', 'border': True, 'entries': [
+                ('Next Action', 'FF6B6B', 'Single next physical action to take'),
+                ('Project', '4ECDC4', 'Multi-step outcome requiring planning'),
+                ('Waiting For', 'A8E6CF', 'Delegated or waiting for external input'),
+                ('Someday/Maybe', 'DDA0DD', 'Ideas to review later'),
+                ('Recurring - Daily', 'FFB6C1', 'Daily habits and routines'),
+                ('Recurring - Weekly', 'E6E6FA', 'Weekly recurring tasks'),
+                ('Recurring - Monthly', 'B0E0E6', 'Monthly recurring tasks'),
+                ('Recurring - Quarterly', 'F0E68C', 'Quarterly reviews and tasks'),
+                ('Ongoing', '87CEEB', 'Continuous improvement areas'),
+            ]},
+            {'heading': 'CONTEXTS', 'border': True, 'gap': 2, 'entries': [
+                ('@Computer', None, 'Tasks requiring laptop/desktop'),
+                ('@Phone', None, 'Calls and phone-based tasks'),
+                ('@Office', None, 'Tasks requiring office presence'),
+                ('@Home', None, 'Tasks to do at home'),
+                ('@Errands', None, 'Out-and-about tasks'),
+                ('@Thinking', None, 'Strategic thinking and planning'),
+                ('@Reading', None, 'Reading and study time'),
+                ('@Anywhere', None, 'Can be done anywhere'),
+                ('@Gym', None, 'Exercise and fitness tasks'),
+            ]},
+            {'heading': 'GTD WORKFLOW REMINDER', 'gap': 2, 'entries': [(step, None, None) for step in [
+                '1. CAPTURE - Collect what has your attention (✓ Done with trigger list)',
+                '2. CLARIFY - Process what each item means',
+                '3. ORGANIZE - Put items where they belong',
+                '4. REFLECT - Review frequently (Weekly Review)',
+                '5. ENGAGE - Simply do (use Next Actions list)',
+            ]]},
+            {'heading': 'PERSONAL CONTEXT NOTES', 'entries': [(note, None, None) for note in [
+                '• 9-month-old daughter (Ananya) - be present, limit device time',
+                '• Wife (MMD) - prioritize relationship and support',
+                '• Work boundaries - flexible but limited hours to avoid burnout',
+                '• Business goal - complete plan Q1 2026, start after leaving job',
+                '• Strategic Innovation Lead role at Upside Learning/UpsideLogic',
+                '• Key accounts: World Bank, HPE, Riyadh Air, CAA, BAT, AstraZeneca',
+            ]]},
+        ],
+        'widths': [25, 50],
+    },
+]
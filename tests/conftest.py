@@ -0,0 +1,22 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WEBAPP = os.path.join(ROOT, 'webapp')
+sys.path.insert(0, WEBAPP)
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client of a fresh app over a SQLite store seeded from gtd_data.json"""
+    import server
+    import storage
+    seed = tmp_path / 'gtd_data.json'
+    shutil.copy(os.path.join(WEBAPP, 'gtd_data.json'), seed)
+    monkeypatch.setattr(server, 'open_store', lambda: storage.SQLiteStore(str(tmp_path / 'gtd_data.db'), str(seed)))
+    monkeypatch.setattr(server, '_store', None)
+    return server.create_app().test_client()
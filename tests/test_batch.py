@@ -0,0 +1,8 @@
+def test_batch_bodies_must_be_objects(client):
+    for url in ('/api/items/batch', '/api/parse/batch'):
+        for body in ('[]', '["buy milk"]', '"buy milk"', '3', 'null', '{"transcript": ["buy milk"]}'):
+            response = client.post(url, data=body, content_type='application/json')
+            assert response.status_code == 400, (url, body)
+            assert response.get_json()['success'] is False
+    response = client.post('/api/parse/batch', json={'transcript': 'Buy milk. Call mom'})
+    assert len(response.get_json()['results']) == 2
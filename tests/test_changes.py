@@ -0,0 +1,14 @@
+def test_push_rejects_bool_ids(client):
+    first = client.get('/api/items/by-id/1').get_json()
+    response = client.post('/api/changes', json={'changes': [{'op': 'delete', 'id': True}]})
+    assert response.status_code == 400
+
+    response = client.post('/api/changes', json={'changes': [{'op': 'upsert', 'item': {'id': True, 'item': 'new'}}]})
+    result = response.get_json()['results'][0]
+    assert result['id'] != 1 and result['client_id'] is True
+    assert client.get('/api/items/by-id/1').get_json() == first
+
+
+def test_push_ignores_bool_since(client):
+    delta = client.post('/api/changes', json={'since': True, 'changes': []}).get_json()
+    assert delta['reset']
@@ -0,0 +1,11 @@
+import importer
+
+
+def test_rows_with_extra_columns_are_reported(tmp_path, capsys):
+    path = tmp_path / 'items.csv'
+    path.write_text('Item,Status\nBuy milk,Next Action\nCall mom,Next Action,,call her back\nShort row\n')
+    items = list(importer.read_source(str(path)))
+    assert [item['item'] for item in items] == ['Buy milk', 'Call mom', 'Short row']
+    assert items[1] == {'item': 'Call mom', 'status': 'Next Action'}
+    warnings = capsys.readouterr().out.splitlines()
+    assert warnings == ['⚠️  items.csv line 3: expected 2 fields, found 4; ignoring the extra ones']
@@ -0,0 +1,62 @@
+import json
+import multiprocessing
+
+import storage
+from cache import DerivedIndex
+
+
+def _add_items(path, tag, count):
+    store = storage.JSONStore(path, compact_every=30, compact_interval=0.2)
+    for i in range(count):
+        store.add({'item': f'{tag}-{i}'})
+
+
+def test_processes_writing_and_compacting_lose_nothing(tmp_path):
+    path = str(tmp_path / 'gtd_data.json')
+    with open(path, 'w') as f:
+        json.dump([{'id': 1, 'item': 'seed'}], f)
+    workers = [multiprocessing.get_context('fork').Process(target=_add_items, args=(path, tag, 64))
+               for tag in 'abcd']
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [worker.exitcode for worker in workers] == [0] * 4
+
+    items = storage.JSONStore(path).all()
+    assert sorted(item['item'] for item in items) == \
+        sorted(['seed'] + [f'{tag}-{i}' for tag in 'abcd' for i in range(64)])
+    assert len({item['id'] for item in items}) == len(items)
+
+
+class CountingIndex(DerivedIndex):
+    rebuilds = 0
+
+    def rebuild(self, items):
+        self.rebuilds += 1
+
+    def apply(self, changes):
+        pass
+
+
+def test_compaction_keeps_the_version(tmp_path):
+    path = str(tmp_path / 'gtd_data.json')
+    with open(path, 'w') as f:
+        json.dump([{'id': 1, 'item': 'seed'}], f)
+    store = storage.JSONStore(path)
+    index = CountingIndex(store)
+    index.current()
+    store.add({'item': 'one'})
+    version = store.version()
+    store.compact()
+    assert store.journal.pending == 0
+    assert store.version() == version
+    index.current()
+    assert index.rebuilds == 1
+
+    # A snapshot replaced from outside the store still moves the version on
+    with open(path, 'w') as f:
+        json.dump([{'id': 1, 'item': 'replaced'}], f)
+    reopened = storage.JSONStore(path)
+    assert reopened.version() > version
+    assert [item['item'] for item in reopened.all()] == ['replaced']
@@ -0,0 +1,17 @@
+import snapshot
+from gtd_data import gtd_items
+
+
+def test_compact_round_trip():
+    items = [{'id': i, **item} for i, item in enumerate(gtd_items, 1)]
+    data = snapshot.dumps(items, 'compact')
+    assert snapshot.detect(data) == 'compact'
+    assert snapshot.loads(data) == items
+
+
+def test_compact_keeps_equal_values_of_different_types():
+    flags = [1, True, 1, True, 0, False, 0.0, 1.0]
+    items = [{'id': i, 'flag': flag} for i, flag in enumerate(flags * 4)]
+    loaded = snapshot.loads(snapshot.dumps(items, 'compact'))
+    assert [(type(item['flag']), item['flag']) for item in loaded] == \
+        [(type(item['flag']), item['flag']) for item in items]
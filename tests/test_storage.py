@@ -0,0 +1,31 @@
+def test_update_returns_stored_text(client):
+    # Warm the indexes first, so the update reaches them as a change
+    assert client.get('/api/items?priority=Low').status_code == 200
+    client.get('/api/stats')
+    client.get('/api/search?q=riyadh')
+
+    response = client.put('/api/items/by-id/1', json={'priority': 3, 'due': 20261231, 'item': 'Riyadh 42'})
+    item = response.get_json()['item']
+    assert item['priority'] == '3' and item['due'] == '20261231'
+    assert client.get('/api/items/by-id/1').get_json() == item
+
+    view = client.get('/api/items?priority=3').get_json()
+    assert [row['id'] for row in view['items']] == [1]
+    assert client.get('/api/items?due_from=2026-01-01').status_code == 200
+    stats = client.get('/api/stats').get_json()
+    assert stats['by_priority']['3'] == 1
+    assert 1 in [row['id'] for row in client.get('/api/search?q=42').get_json()]
+
+
+def test_sqlite_drops_unused_column_indexes(tmp_path):
+    import sqlite3
+    import storage
+    path, seed = str(tmp_path / 'gtd_data.db'), str(tmp_path / 'missing.json')
+    storage.SQLiteStore(path, seed).count()
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE INDEX idx_items_status ON items (status)')
+    conn.commit()
+    conn.close()
+    store = storage.SQLiteStore(path, seed)
+    names = [row[0] for row in store._conn().execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+    assert not [name for name in names if name.startswith('idx_items_')]
@@ -0,0 +1,33 @@
+import json
+
+import storage
+from views import ViewIndex
+
+
+def test_due_range_with_missing_and_non_string_dates(tmp_path):
+    items = [
+        {'id': 1, 'item': 'dated', 'due': '2026-03-01'},
+        {'id': 2, 'item': 'undated'},
+        {'id': 3, 'item': 'empty', 'due': ''},
+        {'id': 4, 'item': 'number', 'due': 20261231},
+        {'id': 5, 'item': 'none', 'due': None},
+    ]
+    path = tmp_path / 'gtd_data.json'
+    path.write_text(json.dumps(items))
+    views = ViewIndex(storage.JSONStore(str(path)))
+
+    page = views.query(due_from='2026-01-01')
+    assert sorted(item['id'] for item in page['items']) == [1, 4]
+    page = views.query(due_from='2026-01-01', due_to='2026-12-31', sort='due')
+    assert [item['id'] for item in page['items']] == [1]
+
+
+def test_forged_cursors_are_rejected(client):
+    from views import encode_cursor
+    page = client.get('/api/items?sort=priority&limit=2').get_json()
+    assert client.get(f"/api/items?sort=priority&limit=2&cursor={page['next_cursor']}").status_code == 200
+    for row in (['High', 1], [1], [1, 2, 3], [True, 1], [1.5, 1], [None, 1]):
+        cursor = encode_cursor('priority', False, row)
+        assert client.get(f'/api/items?sort=priority&cursor={cursor}').status_code == 400
+    cursor = encode_cursor('due', False, [0, '2026-01-01', 1])
+    assert client.get(f'/api/items?sort=due&cursor={cursor}').status_code == 400
@@ -0,0 +1,25 @@
+import io
+
+from openpyxl import load_workbook
+
+from gtd_data import gtd_items
+from gtd_workbook import MASTER_SHEETS, WorkbookCache
+
+
+def test_rebuild_reuses_unchanged_sheets():
+    items = [{'id': i, **item} for i, item in enumerate(gtd_items, 1)]
+    cache = WorkbookCache(MASTER_SHEETS)
+    cache.build(items).save(io.BytesIO())
+    parts = list(cache.wb.parts)
+
+    items[0] = dict(items[0], item='Renamed item')
+    out = io.BytesIO()
+    cache.build(items).save(out)
+    assert 'GTD Master List' in cache.rebuilt
+    for n, sheet in enumerate(MASTER_SHEETS):
+        if sheet['title_sheet'] not in cache.rebuilt:
+            assert cache.wb.parts[n] is parts[n]
+
+    wb = load_workbook(out)
+    assert wb.sheetnames == [sheet['title_sheet'] for sheet in MASTER_SHEETS]
+    assert wb['GTD Master List']['A2'].value == 'Renamed item'
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""GTD Voice App - In-process item cache for the read endpoints"""
+
+import hashlib
+import json
+import threading
+
+
+class ItemCache:
+    """Full item list for GET /api/items, reloaded and re-encoded only when the store signature changes"""
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self._signature = None
+        self._state = ([], None)
+        self._body = None
+
+    def _refresh(self):
+        signature = self.store.signature()
+        if signature != self._signature:
+            with self._lock:
+                if signature != self._signature:
+                    # The signature is read before the items, so a write that lands in
+                    # between only causes one extra reload on the next request
+                    items = self.store.all()
+                    self._state = (items, hashlib.sha1(repr(signature).encode()).hexdigest()[:16])
+                    self._signature = signature
+        return self._state
+
+    def body(self, dumps=json.dumps):
+        """(JSON-encoded item list, etag), encoded once per generation"""
+        items, etag = self._refresh()
+        with self._lock:
+            if self._body is None or self._body[1] != etag:
+                self._body = (dumps(items), etag)
+            return self._body
+
+
+class DerivedIndex:
+    """Base for in-memory structures built from the items and kept in step with the store
+
+    Commits from this process are applied incrementally through apply(); anything else
+    (startup, writes from another process, a missed notification) triggers rebuild().
+    Subclasses implement rebuild(items) and an idempotent apply(changes), and read their
+    state under self._lock after calling current().
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.RLock()
+        self._signature = None
+        store.subscribe(self._on_commit)
+
+    def _on_commit(self, changes, before, after):
+        with self._lock:
+            if self._signature == before:
+                self.apply(changes)
+                self._signature = after
+            elif self._signature != after:
+                self._signature = None  # out of step: rebuild on next read
+
+    def current(self):
+        """Bring the index up to date with the store"""
+        signature = self.store.signature()
+        with self._lock:
+            if signature != self._signature:
+                self.rebuild(self.store.all())
+                self._signature = signature
+
+    def rebuild(self, items):
+        raise NotImplementedError
+
+    def apply(self, changes):
+        raise NotImplementedError
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Streaming item export (XLSX / CSV)"""
+
+import csv
+import io
+import tempfile
+
+# Item field -> column header, in the column order of Shreyas_GTD_Master.xlsx
+COLUMNS = {
+    'item': 'Item',
+    'category': 'Category',
+    'project': 'Project/Area',
+    'context': 'Context',
+    'next_action': 'Next Action',
+    'waiting_for': 'Waiting For',
+    'someday': 'Someday/Maybe',
+    'priority': 'Priority',
+    'status': 'Status',
+    'energy': 'Energy',
+    'time': 'Time Required',
+    'due': 'Due Date',
+    'delegated': 'Delegated To',
+    'notes': 'Notes',
+}
+
+# Rows per chunk yielded by the CSV writer
+CSV_CHUNK_ROWS = 500
+
+
+def rows(items):
+    """Header row, then one row of values per item"""
+    yield list(COLUMNS.values())
+    for item in items:
+        yield [item.get(field, '') for field in COLUMNS]
+
+
+def iter_csv(items):
+    """CSV as a stream of byte chunks (UTF-8 with BOM so Excel detects the encoding)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    for n, row in enumerate(rows(items), 1):
+        writer.writerow(row)
+        if n % CSV_CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+def write_xlsx(items, fileobj):
+    """Single-sheet workbook in write-only mode: rows go straight to disk, not into memory"""
+    from openpyxl import Workbook  # slow to import, and only exports need it
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('GTD Master List')
+    ws.freeze_panes = 'A2'
+    for row in rows(items):
+        ws.append(row)
+    wb.save(fileobj)
+
+
+def xlsx_file(items):
+    """The workbook in a rewound temporary file (kept in memory only while small)"""
+    f = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    write_xlsx(items, f)
+    f.seek(0)
+    return f
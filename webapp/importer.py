@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Bulk import of items into the store
+
+Sources are read as a stream of rows, mapped onto the item schema and written in
+chunks of chunk_size items per transaction (one COMMIT / one journal fsync each):
+    .csv          e.g. Shreyas_GTD_Master_List.csv; headers as in the exported workbooks
+    .xlsx         openpyxl read-only mode; the first sheet, or --sheet
+    .json         a gtd_data.json snapshot (either format)
+    .py           a module defining gtd_items, e.g. gtd_data.py
+
+Each row is hashed over its (whitespace- and case-normalized) fields; rows whose hash
+matches an item already in the store, or an earlier row, are skipped. Memory stays
+bounded by one chunk plus a 16-byte digest per distinct item.
+
+Usage:
+    python importer.py <source> [<source> ...] [--storage sqlite|json] [--sheet NAME]
+                       [--key item,project] [--chunk-size 1000] [--dry-run]
+"""
+
+import argparse
+import csv
+import datetime
+import hashlib
+import itertools
+import os
+import runpy
+import sys
+
+import snapshot
+from storage import FIELDS, open_store
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHUNK_SIZE = 1000
+
+# Rows searched for the header row of a spreadsheet (exports may start with a title)
+HEADER_SCAN_ROWS = 10
+
+# Fields with few distinct values; imported values are interned so items share them
+SHARED_FIELDS = {'category', 'project', 'context', 'someday', 'priority', 'status', 'energy',
+                 'time', 'due', 'delegated'}
+
+
+def _normalize(text):
+    return ' '.join(str(text).split()).casefold()
+
+
+def header_fields():
+    """Normalized column header -> item field: workbook headers, the CSV's spellings and field names"""
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    from gtd_workbook import HEADER_FIELDS
+    mapping = {_normalize(field.replace('_', ' ')): field for field in FIELDS}
+    mapping.update((_normalize(field), field) for field in FIELDS)
+    mapping.update((_normalize(header), field) for header, field in HEADER_FIELDS.items())
+    return mapping
+
+
+def map_headers(headers, source):
+    """Item field (or None) per column; warns about columns that aren't part of the schema"""
+    mapping = header_fields()
+    fields = [mapping.get(_normalize(header)) if header is not None else None for header in headers]
+    unknown = [str(header) for header, field in zip(headers, fields) if field is None and header]
+    if unknown:
+        print(f"⚠️  {os.path.basename(source)}: ignoring columns {', '.join(unknown)}")
+    return fields
+
+
+def _text(value):
+    """Cell or field value as the store's text"""
+    if type(value) is str:
+        return value.strip()
+    if value is None:
+        return ''
+    if isinstance(value, datetime.datetime) and value.time() == datetime.time():
+        value = value.date()
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _rows_to_items(fields, rows, source):
+    """Items from (line, row) pairs; warns about rows with values past the last column"""
+    for line, row in rows:
+        # Read-only sheets pad rows with None up to the widest row; CSV rows aren't padded
+        if any(value is not None for value in row[len(fields):]):
+            print(f"⚠️  {os.path.basename(source)} line {line}: expected {len(fields)} fields, "
+                  f"found {len(row)}; ignoring the extra ones")
+        yield {field: value for field, value in zip(fields, row) if field is not None}
+
+
+def read_csv(path):
+    """Items from a CSV file with a header row"""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        fields = map_headers(next(reader, []), path)
+        yield from _rows_to_items(fields, ((reader.line_num, row) for row in reader), path)
+
+
+def read_xlsx(path, sheet=None):
+    """Items from a worksheet, read in openpyxl's streaming read-only mode"""
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        rows = enumerate(ws.iter_rows(values_only=True), 1)
+        mapping = header_fields()
+        # The header row is the first one naming an item column
+        for _, row in itertools.islice(rows, HEADER_SCAN_ROWS):
+            if any(cell is not None and mapping.get(_normalize(cell)) == 'item' for cell in row):
+                break
+        else:
+            print(f"⚠️  {os.path.basename(path)}: no header row with an Item column")
+            return
+        fields = map_headers(row, path)
+        yield from _rows_to_items(fields, rows, path)
+    finally:
+        wb.close()
+
+
+def read_json(path):
+    """Items from a gtd_data.json snapshot"""
+    yield from snapshot.load(path)
+
+
+def read_py(path):
+    """Items from a module that defines gtd_items (the module is executed)"""
+    yield from runpy.run_path(path)['gtd_items']
+
+
+READERS = {
+    '.csv': read_csv,
+    '.xlsx': read_xlsx,
+    '.json': read_json,
+    '.py': read_py,
+}
+
+
+def read_source(path, sheet=None):
+    """Stream the items of a source file, picking the reader by extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in READERS:
+        raise ValueError(f"Unsupported source: {path} (expected {', '.join(READERS)})")
+    if ext == '.xlsx':
+        return read_xlsx(path, sheet)
+    return READERS[ext](path)
+
+
+def row_hash(item, key_fields=FIELDS):
+    """16-byte digest of an item's normalized key fields"""
+    text = '\0'.join(' '.join(str(item.get(field) or '').split()) for field in key_fields)
+    return hashlib.blake2b(text.casefold().encode(), digest_size=16).digest()
+
+
+def import_items(store, items, key_fields=FIELDS, chunk_size=CHUNK_SIZE, dry_run=False):
+    """Add the items not already in the store; returns counts of added, duplicate and skipped rows"""
+    seen = {row_hash(item, key_fields) for item in store.iter_all()}
+    counts = {'added': 0, 'duplicates': 0, 'skipped': 0}
+    chunk = []
+    for row in items:
+        item = {field: _text(row.get(field)) for field in FIELDS}
+        for field in SHARED_FIELDS:
+            item[field] = sys.intern(item[field])
+        if not item['item']:
+            counts['skipped'] += 1
+            continue
+        digest = row_hash(item, key_fields)
+        if digest in seen:
+            counts['duplicates'] += 1
+            continue
+        seen.add(digest)
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            if not dry_run:
+                store.add_many(chunk)
+            counts['added'] += len(chunk)
+            chunk = []
+    if chunk and not dry_run:
+        store.add_many(chunk)
+    counts['added'] += len(chunk)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sources', nargs='+', help='.csv, .xlsx, .json or .py files')
+    parser.add_argument('--storage', choices=['sqlite', 'json'], help='default: GTD_STORAGE, else sqlite')
+    parser.add_argument('--sheet', help='worksheet to read from .xlsx sources (default: the first)')
+    parser.add_argument('--key', default=','.join(FIELDS),
+                        help='comma-separated fields compared to detect duplicates (default: all)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='items per transaction')
+    parser.add_argument('--dry-run', action='store_true', help='count what would be imported')
+    args = parser.parse_args(argv)
+
+    key_fields = [field.strip() for field in args.key.split(',')]
+    unknown = [field for field in key_fields if field not in FIELDS]
+    if unknown:
+        parser.error(f"unknown --key fields: {', '.join(unknown)}")
+    store = open_store(args.storage)
+    for source in args.sources:
+        counts = import_items(store, read_source(source, args.sheet), key_fields, args.chunk_size, args.dry_run)
+        verb = 'Would import' if args.dry_run else 'Imported'
+        print(f"✅ {verb} {counts['added']:,} items from {os.path.basename(source)} "
+              f"({counts['duplicates']:,} duplicates, {counts['skipped']:,} rows without an item skipped)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Background export jobs"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Finished workbooks kept for reuse, and job records kept for status polling
+KEEP_ARTIFACTS = 5
+KEEP_JOBS = 100
+
+# Fields of a job returned to clients
+PUBLIC_FIELDS = ['id', 'status', 'progress', 'version', 'cached', 'error', 'created', 'finished']
+
+
+class ExportJobs:
+    """Builds workbooks on a background thread, one build per data generation
+
+    submit() returns at once with a job to poll. The finished file is cached under
+    the store signature it was built from, so exporting unchanged data again is
+    instant, and concurrent requests for the same data share one build. Jobs and
+    artifacts live in this process (and its temp directory) only.
+    """
+
+    def __init__(self, store, build, workers=1):
+        self.store = store
+        self.build = build  # build(items, progress) -> openpyxl Workbook
+        self._dir = tempfile.TemporaryDirectory(prefix='gtd-exports-')
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()       # job id -> job
+        self._artifacts = OrderedDict()  # key -> file path, least recently used first
+        self._building = {}              # key -> id of the job building it
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix='gtd-export')
+
+    def submit(self):
+        """Start exporting the current data, or reuse a finished or running build of it"""
+        # Read before the items, so an artifact never holds older data than its key says
+        signature = self.store.signature()
+        key = hashlib.sha1(repr(signature).encode()).hexdigest()[:16]
+        with self._lock:
+            if key in self._building:
+                return self._public(self._jobs[self._building[key]])
+            job = {'id': uuid.uuid4().hex, 'key': key, 'status': 'queued', 'progress': 0.0,
+                   'version': self.store.version_of(signature), 'cached': False, 'error': None,
+                   'created': time.time(), 'finished': None}
+            if key in self._artifacts:
+                self._artifacts.move_to_end(key)
+                job.update(status='done', progress=1.0, cached=True, finished=job['created'])
+            else:
+                self._building[key] = job['id']
+                self._pool.submit(self._run, job)
+            self._jobs[job['id']] = job
+            while len(self._jobs) > KEEP_JOBS:
+                self._jobs.popitem(last=False)
+            return self._public(job)
+
+    def _run(self, job):
+        job['status'] = 'running'
+        try:
+            # Saving the file counts as one more step after the sheets
+            workbook = self.build(self.store.all(),
+                                  lambda done, total: job.update(progress=round(done / (total + 1), 3)))
+            path = os.path.join(self._dir.name, f"export-{job['key']}.xlsx")
+            workbook.save(path)
+            with self._lock:
+                self._artifacts[job['key']] = path
+                while len(self._artifacts) > KEEP_ARTIFACTS:
+                    os.remove(self._artifacts.popitem(last=False)[1])
+            job.update(status='done', progress=1.0)
+        except Exception as e:
+            print(f"❌ Export {job['id']} failed: {e}")
+            job.update(status='failed', error=str(e))
+        finally:
+            job['finished'] = time.time()
+            with self._lock:
+                self._building.pop(job['key'], None)
+
+    def _public(self, job):
+        return {field: job[field] for field in PUBLIC_FIELDS}
+
+    def status(self, job_id):
+        """Public view of a job, or None if unknown"""
+        job = self._jobs.get(job_id)
+        return self._public(job) if job else None
+
+    def artifact(self, job_id):
+        """Path of a finished job's workbook, or None if it isn't available"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job['status'] != 'done':
+                return None
+            return self._artifacts.get(job['key'])
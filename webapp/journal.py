@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Append-only mutation journal for the JSON store
+
+Mutations are appended to ``<snapshot>.journal`` as one JSON line each, so a write
+costs one small append instead of rewriting the whole snapshot. The compactor folds
+the journal back into the snapshot: the new snapshot is written to a temp file and
+renamed into place, then the journal is restarted with a header naming the snapshot
+it applies to.
+
+Journal lines:
+    {"snapshot": <sha1>, "seq": N, "meta": {}}          header: ops below apply on top of <sha1>
+    {"seq": N, "op": "add", ...}                        a mutation
+    {"compact": N, "snapshot": <sha1>, "meta": {}}      <sha1> already contains ops up to seq N
+
+``meta`` carries store state that isn't in the snapshot itself (e.g. the next item id).
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+import snapshot
+from metrics import counter
+
+BYTES_READ = counter('gtd_file_read_bytes_total', 'Bytes read from the JSON store files', ['file'])
+BYTES_WRITTEN = counter('gtd_file_written_bytes_total', 'Bytes written to the JSON store files', ['file'])
+
+
+def _tmp_path(path):
+    # Unique per process and thread, so concurrent writers never share a temp file
+    return f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+
+def atomic_write(path, data):
+    """Write bytes via a temp file + rename, so readers never see a partial file"""
+    tmp = _tmp_path(path)
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    BYTES_WRITTEN.inc(len(data), file=os.path.basename(path))
+
+
+def _digest(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _encode(record):
+    return (json.dumps(record, separators=(',', ':')) + '\n').encode()
+
+
+class Journal:
+    """Snapshot + append-only log pair backing the JSON store"""
+
+    def __init__(self, snapshot_path, log_path=None):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path or f'{snapshot_path}.journal'
+        self.snapshot_digest = None
+        self.base_seq = 0   # seq already folded into the snapshot
+        self.seq = 0        # last seq applied in memory
+        self.offset = 0     # bytes of the log applied in memory
+        self.identity = None  # (snapshot digest, base seq) in the header of the log we follow
+        self._buffer = None
+        self.meta = {}
+        self.format = 'json'  # of the snapshot on disk, detected by load()
+
+    @property
+    def pending(self):
+        """Ops logged since the last compaction"""
+        return self.seq - self.base_seq
+
+    def load(self):
+        """Read the snapshot and the ops still to replay on top of it: (items, ops)"""
+        with open(self.snapshot_path, 'rb') as f:
+            data = f.read()
+        BYTES_READ.inc(len(data), file=os.path.basename(self.snapshot_path))
+        items = snapshot.loads(data)
+        self.format = snapshot.detect(data)
+        self.snapshot_digest = _digest(data)
+
+        records, end = self._read_records(0) if os.path.exists(self.log_path) else ([], 0)
+        header = records[0] if records else {}
+        ops = []
+        if header.get('snapshot') == self.snapshot_digest:
+            self.base_seq = header.get('seq', 0)
+            self.meta = header.get('meta', {})
+            ops = [r for r in records[1:] if 'op' in r]
+            self.seq = ops[-1]['seq'] if ops else self.base_seq
+            # Drop a torn final line left by a crash mid-append
+            if os.path.getsize(self.log_path) != end:
+                os.truncate(self.log_path, end)
+            self.offset = end
+            self.identity = (self.snapshot_digest, self.base_seq)
+            return items, ops
+
+        # A crash between renaming a compacted snapshot and restarting the log
+        # leaves the marker naming the new snapshot and the seq it already holds
+        marker = next((r for r in records if r.get('compact') is not None
+                       and r.get('snapshot') == self.snapshot_digest), None)
+        if marker:
+            self.base_seq = marker['compact']
+            self.meta = marker.get('meta', {})
+            ops = [r for r in records if 'op' in r and r['seq'] > self.base_seq]
+        elif records:
+            print(f"⚠️  {self.log_path} does not match {self.snapshot_path}; ignoring it")
+            # The snapshot was replaced from outside: count it as one more op, so the seq
+            # (the store's version) still only ever increases
+            self.base_seq = max([header.get('seq', 0)] + [r['seq'] for r in records if 'seq' in r]) + 1
+        self.seq = ops[-1]['seq'] if ops else self.base_seq
+        self._restart(b''.join(_encode(op) for op in ops))
+        return items, ops
+
+    def _read_records(self, offset, f=None):
+        """Complete JSON lines from offset onwards, and the offset after the last one"""
+        if f is None:
+            with open(self.log_path, 'rb') as f:
+                return self._read_records(offset, f)
+        f.seek(offset)
+        data = f.read()
+        BYTES_READ.inc(len(data), file=os.path.basename(self.log_path))
+        records = []
+        end = offset
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break   # torn final line from a crash mid-append
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+            end += len(line)
+        return records, end
+
+    def _restart(self, tail):
+        """Start a new log: header for the current snapshot, then the given op lines"""
+        header = _encode({'snapshot': self.snapshot_digest, 'seq': self.base_seq, 'meta': self.meta})
+        atomic_write(self.log_path, header + tail)
+        self.offset = len(header) + len(tail)
+        self.identity = (self.snapshot_digest, self.base_seq)
+
+    def _is_ours(self, f):
+        """Whether the open log is the one we follow, by its header (inodes get reused)"""
+        f.seek(0)
+        try:
+            header = json.loads(f.readline())
+        except ValueError:
+            return False
+        return (header.get('snapshot'), header.get('seq', 0)) == self.identity and 'compact' not in header
+
+    def read_tail(self):
+        """Ops appended by other processes since our offset, or None if the log was replaced
+
+        Called under the store's file lock, so the log can't be replaced while it's read.
+        """
+        try:
+            f = open(self.log_path, 'rb')
+        except FileNotFoundError:
+            return None
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size < self.offset or not self._is_ours(f):
+                return None
+            if size == self.offset:
+                return []
+            records, self.offset = self._read_records(self.offset, f)
+        ops = [r for r in records if 'op' in r and r['seq'] > self.seq]
+        if ops:
+            self.seq = ops[-1]['seq']
+        return ops
+
+    def begin(self):
+        """Start a group commit (caller holds the exclusive lock and has just synced with
+        read_tail()): appends are buffered until commit()"""
+        with open(self.log_path, 'r+b') as f:
+            if not self._is_ours(f):
+                raise RuntimeError(f'{self.log_path} was replaced since it was last read')
+            # Drop anything past the last complete line, e.g. left by another process that crashed
+            if os.fstat(f.fileno()).st_size > self.offset:
+                f.truncate(self.offset)
+        self._buffer = []
+
+    def commit(self):
+        """Write all buffered appends with a single write + fsync"""
+        lines, self._buffer = self._buffer, None
+        if lines:
+            self._write(b''.join(lines))
+
+    def _write(self, data):
+        with open(self.log_path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.offset += len(data)
+        BYTES_WRITTEN.inc(len(data), file=os.path.basename(self.log_path))
+
+    def append(self, op):
+        """Log one mutation (durable once written or committed); returns the op with its seq"""
+        self.seq += 1
+        op = {'seq': self.seq, **op}
+        if self._buffer is not None:
+            self._buffer.append(_encode(op))
+        else:
+            self._write(_encode(op))
+        return op
+
+    def write_snapshot(self, data):
+        """First compaction step (no lock needed): write the new snapshot to a temp file"""
+        tmp = _tmp_path(self.snapshot_path)
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        BYTES_WRITTEN.inc(len(data), file=os.path.basename(self.snapshot_path))
+        return tmp, _digest(data)
+
+    def commit_snapshot(self, tmp, digest, seq, offset, meta):
+        """Second compaction step (under the store lock): swap in the snapshot holding ops up
+        to seq, which ended at log byte offset, and restart the log with any later ops"""
+        marker = _encode({'compact': seq, 'snapshot': digest, 'meta': meta})
+        with open(self.log_path, 'ab') as f:
+            f.write(marker)
+            f.flush()
+            os.fsync(f.fileno())
+        BYTES_WRITTEN.inc(len(marker), file=os.path.basename(self.log_path))
+        os.replace(tmp, self.snapshot_path)
+        records, _ = self._read_records(offset)
+        tail = b''.join(_encode(r) for r in records if 'op' in r and r['seq'] > seq)
+        self.snapshot_digest = digest
+        self.base_seq = seq
+        self.meta = meta
+        self._restart(tail)
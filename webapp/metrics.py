@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Prometheus metrics and slow-request profiling
+
+Counters and histograms live in this process and are rendered in the Prometheus text
+format by /api/metrics; with several gunicorn workers, each worker reports its own.
+Modules declare their metrics at import time with counter() / histogram().
+"""
+
+import bisect
+import cProfile
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+
+# Histogram buckets, in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+PARSE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01)
+
+# Slow-request profiles kept on disk
+PROFILE_KEEP = 50
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+def _format_number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count per label combination"""
+    kind = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        """(name, label names, label values, value) for every series"""
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield self.name, self.labels, key, value
+
+
+class Histogram:
+    """Observation counts in cumulative buckets, plus their sum, per label combination"""
+    kind = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}  # label values -> [count per bucket (last is +Inf), sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][i] += 1
+            state[1] += value
+
+    def samples(self):
+        with self._lock:
+            values = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        names = self.labels + ('le',)
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                yield f'{self.name}_bucket', names, key + (_format_number(bound),), cumulative
+            yield f'{self.name}_sum', self.labels, key, total
+            yield f'{self.name}_count', self.labels, key, cumulative
+
+
+class Registry:
+    """Every metric of the process, in declaration order"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name, help, labels=()):
+        metric = Counter(name, help, labels)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        metric = Histogram(name, help, labels, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, label_names, label_values, value in metric.samples():
+                lines.append(f'{name}{_format_labels(label_names, label_values)} {_format_number(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+counter = REGISTRY.counter
+histogram = REGISTRY.histogram
+
+PROFILES = counter('gtd_slow_request_profiles_total', 'Slow requests whose cProfile stats were saved')
+
+
+class SlowRequestProfiler:
+    """Opt-in cProfile of sampled requests, saved when they turn out to be slow
+
+    Off unless GTD_PROFILE_SLOW_MS is set. Then a share of requests (GTD_PROFILE_SAMPLE,
+    default 1.0) runs under cProfile, one request at a time, and each one slower than the
+    threshold is dumped as a pstats file into GTD_PROFILE_DIR (default: a gtd-profiles
+    directory in the system temp dir). Read them with ``python -m pstats <file>``.
+    """
+
+    def __init__(self, threshold_ms=None, sample=1.0, directory=None, keep=PROFILE_KEEP):
+        self.threshold_ms = threshold_ms
+        self.sample = sample
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'gtd-profiles')
+        self.keep = keep
+        self._lock = threading.Lock()  # cProfile can only run one profile at a time
+
+    @classmethod
+    def from_env(cls):
+        threshold = os.environ.get('GTD_PROFILE_SLOW_MS')
+        return cls(float(threshold) if threshold else None,
+                   float(os.environ.get('GTD_PROFILE_SAMPLE', 1.0)),
+                   os.environ.get('GTD_PROFILE_DIR'))
+
+    @property
+    def enabled(self):
+        return self.threshold_ms is not None
+
+    def start(self):
+        """A running profile for this request, or None if it isn't sampled"""
+        if not self.enabled or random.random() >= self.sample or not self._lock.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler is active
+            self._lock.release()
+            return None
+        return profile
+
+    def finish(self, profile, label, seconds):
+        """Stop a profile from start(); returns the dump's path if the request was slow"""
+        profile.disable()
+        self._lock.release()
+        elapsed_ms = seconds * 1000
+        if elapsed_ms < self.threshold_ms:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', label).strip('_')
+        path = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}-{elapsed_ms:.0f}ms.prof")
+        profile.dump_stats(path)
+        PROFILES.inc()
+        dumps = sorted((entry.path for entry in os.scandir(self.directory) if entry.name.endswith('.prof')),
+                       key=os.path.getmtime)
+        for old in dumps[:-self.keep]:
+            os.remove(old)
+        print(f"🐢 {label} took {elapsed_ms:.0f} ms; profile saved to {path}")
+        return path
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Fuzzy item resolver for spoken commands
+
+Maps the remainder of "complete / delete / update <name>" to item ids through an index
+of character trigrams over each item's title and next action. Trigrams are taken per
+word (padded like pg_trgm: "  c", " ca", "cal", "all", "ll "), so word order and
+small mishearings cost little.
+
+A field scores mostly by the share of the spoken trigrams it contains (a fragment of a
+long title still matches), plus a little for their Dice coefficient (an exact title beats
+a longer one). Trigrams found in many items ("the", " th", ...) are left out, like
+stopwords. The rest are counted rarest first, and once the ones left are too few to lift
+a field to min_score on their own they only top up the fields already found, so long
+posting lists are rarely read in full.
+"""
+
+import heapq
+import math
+import sys
+from collections import Counter
+from itertools import chain
+
+from cache import DerivedIndex
+from search import tokenize
+
+# Fields matched against, and their weight
+RESOLVE_FIELDS = (('item', 1.0), ('next_action', 0.9))
+
+MIN_SCORE = 0.6
+
+# Share of the score from containment; the rest is the Dice coefficient
+CONTAINMENT_WEIGHT = 0.75
+
+# How far the best match must lead the runner-up to be acted on without confirmation
+AMBIGUITY_MARGIN = 0.1
+
+# Trigrams in more than this share of items ("the", " th", ...) are left out of the
+# score, like stopwords, unless the spoken text has nothing rarer
+COMMON_SHARE = 0.05
+COMMON_MIN = 50
+
+
+def trigrams(text):
+    """Distinct padded trigrams of each word, in first-seen order"""
+    grams = {}
+    for word in tokenize(text):
+        padded = f'  {word} '
+        for i in range(len(word) + 1):
+            grams.setdefault(sys.intern(padded[i:i + 3]))
+    return tuple(grams)
+
+
+def _needed(score, total):
+    # Shared trigrams a field needs to reach score (Dice adds at most 1 - CONTAINMENT_WEIGHT)
+    return (score - (1 - CONTAINMENT_WEIGHT)) / CONTAINMENT_WEIGHT * total
+
+
+class ResolverIndex(DerivedIndex):
+    """Trigram index over item titles and next actions
+
+    Postings hold one key per field, item_id * len(RESOLVE_FIELDS) + field index, so
+    counting them gives each field's overlap without reading the items back. They are
+    sets, so an update removes an item's keys in O(1) each.
+    """
+
+    def rebuild(self, items):
+        self.postings = {}  # trigram -> set of field keys
+        self.docs = {}      # item_id -> (item, trigrams per field)
+        self.doc_count = 0
+        for item in items:
+            self._add(item)
+
+    def apply(self, changes):
+        for kind, item in changes:
+            self._remove(item['id'])
+            if kind == 'upsert':
+                self._add(item)
+
+    def _add(self, item):
+        fields = tuple(trigrams(item.get(field)) for field, _ in RESOLVE_FIELDS)
+        for i, field_grams in enumerate(fields):
+            key = item['id'] * len(RESOLVE_FIELDS) + i
+            for gram in field_grams:
+                posting = self.postings.get(gram)
+                if posting is None:
+                    posting = self.postings[gram] = set()
+                posting.add(key)
+        self.docs[item['id']] = (item, fields)
+
+    def _remove(self, item_id):
+        doc = self.docs.pop(item_id, None)
+        if doc is None:
+            return
+        for i, field_grams in enumerate(doc[1]):
+            key = item_id * len(RESOLVE_FIELDS) + i
+            for gram in field_grams:
+                posting = self.postings[gram]
+                posting.discard(key)
+                if not posting:
+                    del self.postings[gram]
+
+    def resolve(self, text, limit=5, min_score=MIN_SCORE, skip_status=None):
+        """Best-matching items for spoken text: [{'id', 'item', 'next_action', 'status', 'score'}]"""
+        spoken = set(trigrams(text))
+        if not spoken:
+            return []
+        self.current()
+        with self._lock:
+            docs = len(self.docs) or 1
+            frequency = {gram: len(self.postings.get(gram, ())) for gram in spoken}
+            common = max(COMMON_MIN, COMMON_SHARE * docs * len(RESOLVE_FIELDS))
+            spoken = {gram for gram in spoken if frequency[gram] <= common} or spoken
+            needed = math.ceil(_needed(min_score, len(spoken)))
+
+            # Rarest trigrams first: count each field's shared trigrams. Once the ones left
+            # are too few to lift a field to min_score on their own, they only top up the
+            # fields already found.
+            ordered = sorted(spoken, key=frequency.get)
+            scan = len(spoken) - needed + 1
+            shared = Counter(chain.from_iterable(self.postings.get(gram, ()) for gram in ordered[:scan]))
+            for gram in ordered[scan:]:
+                shared.update(shared.keys() & self.postings.get(gram, set()))
+
+            best = {}
+            fields = len(RESOLVE_FIELDS)
+            for key, count in shared.items():
+                if count < needed:
+                    continue
+                item_id, i = divmod(key, fields)
+                field_grams = self.docs[item_id][1][i]
+                score = RESOLVE_FIELDS[i][1] * (CONTAINMENT_WEIGHT * count / len(spoken) + (1 - CONTAINMENT_WEIGHT)
+                                                * 2 * count / (len(spoken) + len(field_grams)))
+                if score >= min_score and score > best.get(item_id, 0):
+                    best[item_id] = score
+            if skip_status:
+                best = {item_id: score for item_id, score in best.items()
+                        if self.docs[item_id][0].get('status') != skip_status}
+            matches = []
+            for item_id, score in heapq.nsmallest(limit, best.items(), key=lambda pair: (-pair[1], pair[0])):
+                item = self.docs[item_id][0]
+                matches.append({'id': item_id, 'item': item.get('item', ''), 'next_action': item.get('next_action', ''),
+                                'status': item.get('status', ''), 'score': round(score, 3)})
+            return matches
+
+
+def unambiguous(matches, margin=AMBIGUITY_MARGIN):
+    """The match to act on without asking, or None"""
+    if not matches:
+        return None
+    if len(matches) == 1 or matches[0]['score'] - matches[1]['score'] >= margin:
+        return matches[0]
+    return None
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Full-text search index"""
+
+import bisect
+import heapq
+import math
+import re
+
+from cache import DerivedIndex
+
+# Searchable fields and how much a hit in each one counts
+FIELD_WEIGHTS = {
+    'item': 3.0,
+    'project': 2.0,
+    'next_action': 1.5,
+    'waiting_for': 1.0,
+    'delegated': 1.0,
+    'notes': 0.5,
+}
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Cap on how many vocabulary words a typeahead prefix expands to
+MAX_PREFIX_TERMS = 64
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(str(text or '').lower())
+
+
+class SearchIndex(DerivedIndex):
+    """Inverted index over the item text fields with prefix matching and TF-IDF ranking"""
+
+    def rebuild(self, items):
+        self.postings = {}  # token -> {item_id: weight}
+        self.docs = {}      # item_id -> (item, {token: weight})
+        self.vocab = []     # sorted tokens, for prefix lookups
+        for item in items:
+            self._add(item)
+
+    def apply(self, changes):
+        for kind, item in changes:
+            self._remove(item['id'])
+            if kind == 'upsert':
+                self._add(item)
+
+    def _add(self, item):
+        weights = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(item.get(field)):
+                weights[token] = weights.get(token, 0) + weight
+        for token, weight in weights.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = {}
+                bisect.insort(self.vocab, token)
+            posting[item['id']] = weight
+        self.docs[item['id']] = (item, weights)
+
+    def _remove(self, item_id):
+        doc = self.docs.pop(item_id, None)
+        if doc is None:
+            return
+        for token in doc[1]:
+            posting = self.postings[token]
+            del posting[item_id]
+            if not posting:
+                del self.postings[token]
+                del self.vocab[bisect.bisect_left(self.vocab, token)]
+
+    def _expand(self, prefix):
+        start = bisect.bisect_left(self.vocab, prefix)
+        terms = []
+        for token in self.vocab[start:start + MAX_PREFIX_TERMS]:
+            if not token.startswith(prefix):
+                break
+            terms.append(token)
+        return terms
+
+    def search(self, query, limit=50):
+        """Items matching every query word (the last one as a prefix), best first"""
+        words = tokenize(query)
+        if not words:
+            return []
+        self.current()
+        with self._lock:
+            total = len(self.docs) or 1
+            scores = None
+            for i, word in enumerate(words):
+                # The word still being typed matches as a prefix; exact hits rank higher
+                terms = self._expand(word) if i == len(words) - 1 else [word]
+                word_scores = {}
+                for term in terms:
+                    posting = self.postings.get(term, {})
+                    idf = math.log(1 + total / len(posting)) if posting else 0
+                    boost = 1.0 if term == word else 0.5
+                    for item_id, weight in posting.items():
+                        word_scores[item_id] = word_scores.get(item_id, 0) + weight * idf * boost
+                if scores is None:
+                    scores = word_scores
+                else:
+                    scores = {item_id: score + word_scores[item_id]
+                              for item_id, score in scores.items() if item_id in word_scores}
+                if not scores:
+                    return []
+            ranked = heapq.nsmallest(limit, scores.items(), key=lambda pair: (-pair[1], pair[0]))
+            return [{**self.docs[item_id][0], 'score': round(score, 3)} for item_id, score in ranked]
@@ -1,168 +1,96 @@
 #!/usr/bin/env python3
 """GTD Voice App - Flask Server"""
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Blueprint, Flask, current_app, g, render_template, request, jsonify, send_file
 from flask_cors import CORS
-import json
+import hashlib
 import os
-import re
+import sys
+import threading
+import time
 from datetime import datetime
 
-app = Flask(__name__)
-CORS(app)
-
-DATA_FILE = os.path.join(os.path.dirname(__file__), 'gtd_data.json')
-
-# Initialize data file if not exists
-def init_data():
-    if not os.path.exists(DATA_FILE):
-        # Import from gtd_data.py
-        import sys
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-        from gtd_data import gtd_items
-        save_data(gtd_items)
-        return gtd_items
-    return load_data()
-
-def load_data():
-    with open(DATA_FILE, 'r') as f:
-        return json.load(f)
-
-def save_data(data):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
-
-def parse_voice_input(text):
-    """Parse voice input and determine action and item details"""
-    text_lower = text.lower().strip()
-    
-    result = {
-        'action': 'add',  # add, complete, update, delete
-        'item': '',
-        'category': 'Personal',
-        'project': '',
-        'context': '@Anywhere',
-        'priority': 'Medium',
-        'status': 'Next Action',
-        'next_action': '',
-        'notes': '',
-        'parsed_info': []
-    }
-    
-    # Detect action
-    if any(text_lower.startswith(w) for w in ['complete ', 'done ', 'finished ', 'mark complete ']):
-        result['action'] = 'complete'
-        text = re.sub(r'^(complete|done|finished|mark complete)\s+', '', text, flags=re.IGNORECASE)
-    elif any(text_lower.startswith(w) for w in ['delete ', 'remove ']):
-        result['action'] = 'delete'
-        text = re.sub(r'^(delete|remove)\s+', '', text, flags=re.IGNORECASE)
-    elif any(text_lower.startswith(w) for w in ['update ', 'change ']):
-        result['action'] = 'update'
-        text = re.sub(r'^(update|change)\s+', '', text, flags=re.IGNORECASE)
-    
-    # Detect category
-    if any(w in text_lower for w in ['work', 'professional', 'office', 'upside', 'client', 'project']):
-        result['category'] = 'Professional'
-        result['parsed_info'].append('Category: Professional')
-    
-    # Detect priority
-    if any(w in text_lower for w in ['critical', 'urgent', 'asap', 'immediately']):
-        result['priority'] = 'Critical'
-        result['parsed_info'].append('Priority: Critical')
-    elif any(w in text_lower for w in ['high priority', 'important', 'high']):
-        result['priority'] = 'High'
-        result['parsed_info'].append('Priority: High')
-    elif any(w in text_lower for w in ['low priority', 'someday', 'when possible', 'low']):
-        result['priority'] = 'Low'
-        result['parsed_info'].append('Priority: Low')
-    
-    # Detect context
-    contexts = {
-        '@Computer': ['computer', 'laptop', 'online', 'email', 'digital'],
-        '@Phone': ['call', 'phone', 'ring'],
-        '@Office': ['office', 'meeting', 'upside'],
-        '@Home': ['home', 'house'],
-        '@Errands': ['buy', 'shop', 'pick up', 'errand', 'store'],
-        '@Thinking': ['think', 'decide', 'plan', 'strategy', 'consider'],
-        '@Reading': ['read', 'book', 'article'],
-    }
-    for ctx, keywords in contexts.items():
-        if any(w in text_lower for w in keywords):
-            result['context'] = ctx
-            result['parsed_info'].append(f'Context: {ctx}')
-            break
-    
-    # Detect project/account
-    accounts = {
-        'World Bank Group': ['world bank', 'wb', 'skills framework', 'qii', 'climate toolkit'],
-        'HPE': ['hpe', 'clearbook', 'hewlett'],
-        'CAA': ['caa', 'cybersecurity', 'axiom', 'sap project'],
-        'Riyadh Air': ['riyadh', 'riyadh air', 'safety sense'],
-        'AstraZeneca': ['astrazeneca', 'az', 'astra'],
-        'BAT': ['bat', 'british american', 'webinar tours'],
-        'Business Planning': ['business plan', 'new business', 'startup'],
-        'Family - Children': ['ananya', 'daughter', 'baby'],
-        'Family - Partner': ['mmd', 'wife'],
-        'Family - Parents': ['parents', 'mom', 'dad', 'father', 'mother'],
-        'Health': ['health', 'doctor', 'gym', 'exercise', 'diet', 'sleep'],
-        'AI Skills Development': ['ai', 'artificial intelligence', 'prompt', 'claude', 'gpt'],
-    }
-    for proj, keywords in accounts.items():
-        if any(w in text_lower for w in keywords):
-            result['project'] = proj
-            result['parsed_info'].append(f'Project: {proj}')
-            if proj in ['World Bank Group', 'HPE', 'CAA', 'Riyadh Air', 'AstraZeneca', 'BAT']:
-                result['category'] = 'Professional'
-            break
-    
-    # Detect status
-    if 'waiting for' in text_lower or 'waiting on' in text_lower:
-        result['status'] = 'Waiting For'
-        result['parsed_info'].append('Status: Waiting For')
-    elif 'someday' in text_lower or 'maybe' in text_lower:
-        result['status'] = 'Someday/Maybe'
-        result['parsed_info'].append('Status: Someday/Maybe')
-    elif 'recurring' in text_lower or 'daily' in text_lower or 'weekly' in text_lower:
-        if 'daily' in text_lower:
-            result['status'] = 'Recurring - Daily'
-        elif 'weekly' in text_lower:
-            result['status'] = 'Recurring - Weekly'
-        elif 'monthly' in text_lower:
-            result['status'] = 'Recurring - Monthly'
-        result['parsed_info'].append(f"Status: {result['status']}")
-    
-    # Clean up the item text
-    clean_text = text
-    # Remove detected keywords for cleaner item name
-    remove_patterns = [
-        r'\b(high priority|low priority|critical|urgent)\b',
-        r'\b(for work|for office|professional|personal)\b',
-        r'\b(someday|maybe|waiting for|waiting on)\b',
-        r'\b(daily|weekly|monthly|recurring)\b',
-    ]
-    for pattern in remove_patterns:
-        clean_text = re.sub(pattern, '', clean_text, flags=re.IGNORECASE)
-    
-    result['item'] = clean_text.strip()
-    result['next_action'] = result['item']
-    
-    return result
+from cache import ItemCache
+from dedupe import DUPLICATE_THRESHOLD, DuplicateIndex
+from export import iter_csv, xlsx_file
+from jobs import ExportJobs
+from metrics import CONTENT_TYPE, REGISTRY, SlowRequestProfiler, counter, histogram
+from resolver import ResolverIndex, unambiguous
+from search import SearchIndex
+from stats import StatsIndex
+from stream import ChangeStream
+from storage import open_store
+from views import FILTER_FIELDS, ViewIndex
+from voice_parser import parse_batch, parse_voice_input, split_transcript
+from writer import Writer
 
-@app.route('/')
-def index():
-    return render_template('index.html')
+bp = Blueprint('gtd', __name__)
 
-@app.route('/api/items', methods=['GET'])
-def get_items():
-    items = load_data()
-    return jsonify(items)
+REQUESTS = counter('gtd_requests_total', 'HTTP requests handled', ['method', 'route', 'status'])
+REQUEST_SECONDS = histogram('gtd_request_duration_seconds', 'Time to build each response',
+                            ['method', 'route'])
+_profiler = SlowRequestProfiler.from_env()
 
-@app.route('/api/items', methods=['POST'])
-def add_item():
-    data = request.json
-    items = load_data()
-    
-    new_item = {
+# Most utterances accepted by one /batch request
+MAX_BATCH = 500
+
+# Most changes accepted by one POST /api/changes
+MAX_PUSH = 1000
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Download name of exports, without extension
+EXPORT_NAME = 'Shreyas_GTD_Master'
+
+# Voice commands that act on an existing item, resolved by name
+ITEM_ACTIONS = ('complete', 'delete', 'update')
+
+# Query parameters that turn GET /api/items into a filtered, paginated view
+VIEW_PARAMS = set(FILTER_FIELDS) | {'due_from', 'due_to', 'sort', 'cursor', 'limit'}
+
+_store = None
+_cache = None
+_writer = None
+_search = None
+_resolver = None
+_duplicates = None
+_stream = None
+_stats = None
+_views = None
+_exports = None
+_workbooks = None
+_store_lock = threading.Lock()
+
+def get_store():
+    """Open the item store on first use (imports gtd_data.json / gtd_items on first start)"""
+    global _store, _cache, _writer, _search, _resolver, _duplicates, _stream, _stats, _views, _exports
+    with _store_lock:
+        if _store is None:
+            _store = open_store()
+            _cache = ItemCache(_store)
+            _writer = Writer(_store)
+            _search = SearchIndex(_store)
+            _resolver = ResolverIndex(_store)
+            _duplicates = DuplicateIndex(_store)
+            _stream = ChangeStream(_store)
+            _stats = StatsIndex(_store)
+            _views = ViewIndex(_store)
+            _exports = ExportJobs(_store, _master_workbook)
+    return _store
+
+def get_cache():
+    """Shared item cache for the read-only endpoints"""
+    get_store()
+    return _cache
+
+def write(fn, *args):
+    """Run fn(store, *args) on the single writer thread; concurrent calls share one commit"""
+    get_store()
+    return _writer.submit(fn, *args)
+
+def _new_item(data):
+    """A full item from request data (or a parse result), with defaults for missing fields"""
+    return {
         'item': data.get('item', ''),
         'category': data.get('category', 'Personal'),
         'project': data.get('project', ''),
@@ -178,116 +106,422 @@ def add_item():
         'delegated': data.get('delegated', ''),
         'notes': data.get('notes', f"Added via voice on {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     }
+
+def _master_workbook(items, progress):
+    """The 15-sheet workbook of create_excel.py, re-rendering only the sheets that changed
+
+    Runs on the single export worker, which saves each workbook before building the next.
+    """
+    global _workbooks
+    if _workbooks is None:
+        if ROOT_DIR not in sys.path:
+            sys.path.insert(0, ROOT_DIR)
+        from gtd_workbook import MASTER_SHEETS, WorkbookCache
+        _workbooks = WorkbookCache(MASTER_SHEETS)
+    return _workbooks.build(items, progress)
+
+def _add(store, item):
+    return store.add(item), store.count()
+
+def _add_many(store, items):
+    return store.add_many(items), store.count()
+
+def _batch_texts(data):
+    """Utterances from a batch request: {"texts": [...]} or {"transcript": "..."}"""
+    if not isinstance(data, dict):
+        return None, 'Body must be a JSON object'
+    if 'texts' in data:
+        texts = data['texts']
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            return None, 'texts must be a list of strings'
+        texts = [t.strip() for t in texts if t.strip()]
+    else:
+        transcript = data.get('transcript', '')
+        if not isinstance(transcript, str):
+            return None, 'transcript must be a string'
+        texts = split_transcript(transcript)
+    if len(texts) > MAX_BATCH:
+        return None, f'At most {MAX_BATCH} utterances per batch'
+    return texts, None
+
+def _push_changes(data):
+    """Validated client changes: [{"op": "upsert", "item": {...}} | {"op": "delete", "id": N}]"""
+    changes = (data or {}).get('changes')
+    if not isinstance(changes, list):
+        return None, 'changes must be a list'
+    if len(changes) > MAX_PUSH:
+        return None, f'At most {MAX_PUSH} changes per push'
+    for change in changes:
+        if not isinstance(change, dict) or change.get('op') not in ('upsert', 'delete'):
+            return None, 'each change needs an op of upsert or delete'
+        if change['op'] == 'upsert' and not isinstance(change.get('item'), dict):
+            return None, 'upserts need an item'
+        # type() rather than isinstance(): JSON true is a bool, and bools are ints
+        if change['op'] == 'delete' and type(change.get('id')) is not int:
+            return None, 'deletes need an id'
+    return changes, None
+
+def _apply_changes(store, changes):
+    # Last writer wins. An upsert of an id the store doesn't have (created offline, or
+    # deleted here meanwhile) adds a new item; the result maps its client id to the new one.
+    results = []
+    for change in changes:
+        if change['op'] == 'delete':
+            deleted = store.delete(change['id'])
+            results.append({'op': 'delete', 'id': change['id'], 'deleted': deleted is not None})
+            continue
+        item = change['item']
+        item_id = item.get('id')
+        data = {k: v for k, v in item.items() if k != 'id'}
+        updated = store.update(item_id, data) if type(item_id) is int else None
+        if updated is not None:
+            results.append({'op': 'upsert', 'id': item_id, 'item': updated})
+        else:
+            added = store.add(data)
+            results.append({'op': 'upsert', 'id': added['id'], 'client_id': item_id, 'item': added})
+    return results
+
+def _resolve(store, index, item_id):
+    """Item id for a route addressed by id, or by list position on the legacy routes"""
+    return item_id if index is None else store.id_at(index)
+
+def _complete(store, index, item_id):
+    item_id = _resolve(store, index, item_id)
+    item = store.get(item_id)
+    if item is None:
+        return None
+    return store.update(item_id, {
+        'status': 'Completed',
+        'notes': f"{item.get('notes', '')} | Completed {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    })
+
+def _parsed_changes(parsed):
+    """Fields an update command spoke about, e.g. "update quarterly report high priority" -> priority"""
+    labels = {info.split(':', 1)[0].lower() for info in parsed['parsed_info']}
+    return {field: parsed[field] for field in ('category', 'priority', 'context', 'project', 'status') if field in labels}
+
+@bp.route('/')
+def index():
+    return render_template('index.html')
+
+@bp.route('/api/items', methods=['GET'])
+def get_items():
+    if VIEW_PARAMS & set(request.args):
+        return get_view()
+    body, etag = get_cache().body(current_app.json.dumps)
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+    # Let the browser keep its copy but revalidate it on every poll
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def get_view():
+    """One page of items, e.g. ?status=Next Action&context=@Phone&sort=priority&limit=50
+
+    Filters can be repeated to accept several values; sort=-field sorts descending.
+    The response's next_cursor fetches the following page.
+    """
+    etag = hashlib.sha1(f'{get_store().signature()!r}?{request.query_string!r}'.encode()).hexdigest()[:16]
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        sort = request.args.get('sort', 'id')
+        try:
+            view = _views.query(
+                filters={field: request.args.getlist(field) for field in FILTER_FIELDS if field in request.args},
+                due_from=request.args.get('due_from'),
+                due_to=request.args.get('due_to'),
+                sort=sort.lstrip('-'),
+                descending=sort.startswith('-'),
+                cursor=request.args.get('cursor'),
+                limit=request.args.get('limit', 50, type=int),
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        response = jsonify(view)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@bp.route('/api/items', methods=['POST'])
+def add_item():
+    data = request.json
+    new_item = _new_item(data)
+    get_store()
+    duplicates = _duplicates.similar(new_item['item'])
+    new_item, total = write(_add, new_item)
+    
+    return jsonify({'success': True, 'item': new_item, 'total': total, 'duplicates': duplicates})
+
+@bp.route('/api/items/batch', methods=['POST'])
+def add_items_batch():
+    """Parse a list of utterances (or a transcript) and add them all in one commit"""
+    texts, error = _batch_texts(request.json)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
     
-    items.append(new_item)
-    save_data(items)
+    results = []
+    new_items = []
+    for text, parsed in zip(texts, parse_batch(texts)):
+        if parsed['action'] != 'add':
+            results.append({'text': text, 'success': False,
+                            'error': f"'{parsed['action']}' commands can't be batched"})
+        elif not parsed['item']:
+            results.append({'text': text, 'success': False, 'error': 'Nothing to add'})
+        else:
+            results.append({'text': text, 'success': True, 'parsed_info': parsed['parsed_info']})
+            new_items.append(_new_item(parsed))
+    
+    added, total = write(_add_many, new_items)
+    added = iter(added)
+    for result in results:
+        if result['success']:
+            result['item'] = next(added)
+    
+    return jsonify({'success': True, 'added': len(new_items), 'total': total, 'results': results})
+
+@bp.route('/api/items/by-id/<int:item_id>', methods=['GET'])
+def get_item(item_id):
+    item = get_store().get(item_id)
+    
+    if item is not None:
+        return jsonify(item)
     
-    return jsonify({'success': True, 'item': new_item, 'total': len(items)})
+    return jsonify({'success': False, 'error': 'Item not found'}), 404
 
-@app.route('/api/items/<int:index>', methods=['PUT'])
-def update_item(index):
+@bp.route('/api/items/<int:index>', methods=['PUT'])
+@bp.route('/api/items/by-id/<int:item_id>', methods=['PUT'])
+def update_item(index=None, item_id=None):
     data = request.json
-    items = load_data()
+    item = write(lambda store: store.update(_resolve(store, index, item_id), data))
     
-    if 0 <= index < len(items):
-        items[index].update(data)
-        save_data(items)
-        return jsonify({'success': True, 'item': items[index]})
+    if item is not None:
+        return jsonify({'success': True, 'item': item})
     
     return jsonify({'success': False, 'error': 'Item not found'}), 404
 
-@app.route('/api/items/<int:index>/complete', methods=['POST'])
-def complete_item(index):
-    items = load_data()
+@bp.route('/api/items/<int:index>/complete', methods=['POST'])
+@bp.route('/api/items/by-id/<int:item_id>/complete', methods=['POST'])
+def complete_item(index=None, item_id=None):
+    item = write(_complete, index, item_id)
     
-    if 0 <= index < len(items):
-        items[index]['status'] = 'Completed'
-        items[index]['notes'] = f"{items[index].get('notes', '')} | Completed {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        save_data(items)
-        return jsonify({'success': True, 'item': items[index]})
+    if item is not None:
+        return jsonify({'success': True, 'item': item})
     
     return jsonify({'success': False, 'error': 'Item not found'}), 404
 
-@app.route('/api/items/<int:index>', methods=['DELETE'])
-def delete_item(index):
-    items = load_data()
+@bp.route('/api/items/<int:index>', methods=['DELETE'])
+@bp.route('/api/items/by-id/<int:item_id>', methods=['DELETE'])
+def delete_item(index=None, item_id=None):
+    deleted = write(lambda store: store.delete(_resolve(store, index, item_id)))
     
-    if 0 <= index < len(items):
-        deleted = items.pop(index)
-        save_data(items)
+    if deleted is not None:
         return jsonify({'success': True, 'deleted': deleted})
     
     return jsonify({'success': False, 'error': 'Item not found'}), 404
 
-@app.route('/api/parse', methods=['POST'])
+@bp.route('/api/parse', methods=['POST'])
 def parse_input():
+    """Parse an utterance; with "execute": true, also carry out the command
+
+    complete / delete / update commands get the items their name matches, best first.
+    Executing acts on "item_id" if given, else on the best match when it clearly leads.
+    """
     data = request.json
     text = data.get('text', '')
     parsed = parse_voice_input(text)
-    return jsonify(parsed)
-
-@app.route('/api/search', methods=['GET'])
-def search_items():
-    query = request.args.get('q', '').lower()
-    items = load_data()
+    action = parsed['action']
+    get_store()
+    if action == 'add':
+        parsed['duplicates'] = _duplicates.similar(parsed['item'])
+    elif action in ITEM_ACTIONS:
+        parsed['matches'] = _resolver.resolve(parsed['item'], skip_status='Completed' if action == 'complete' else None)
+    if not data.get('execute'):
+        return jsonify(parsed)
     
-    results = []
-    for i, item in enumerate(items):
-        if query in item.get('item', '').lower() or query in item.get('project', '').lower():
-            results.append({'index': i, **item})
+    if action == 'add':
+        if not parsed['item']:
+            return jsonify({**parsed, 'success': False, 'error': 'Nothing to add'}), 400
+        new_item, total = write(_add, _new_item(parsed))
+        return jsonify({**parsed, 'success': True, 'item': new_item, 'total': total})
     
-    return jsonify(results)
-
-@app.route('/api/stats', methods=['GET'])
-def get_stats():
-    items = load_data()
+    changes = _parsed_changes(parsed) if action == 'update' else None
+    if changes == {}:
+        return jsonify({**parsed, 'success': False, 'error': 'Nothing to update'}), 400
+    item_id = data.get('item_id')
+    if item_id is None:
+        match = unambiguous(parsed['matches'])
+        if match is None:
+            error = 'Several items match' if parsed['matches'] else 'No matching item'
+            return jsonify({**parsed, 'success': False, 'error': error}), 409 if parsed['matches'] else 404
+        item_id = match['id']
+    if action == 'complete':
+        item = write(_complete, None, item_id)
+    elif action == 'delete':
+        item = write(lambda store: store.delete(item_id))
+    else:
+        item = write(lambda store: store.update(item_id, changes))
     
-    stats = {
-        'total': len(items),
-        'by_category': {},
-        'by_priority': {},
-        'by_status': {},
-        'by_context': {}
-    }
-    
-    for item in items:
-        cat = item.get('category', 'Unknown')
-        pri = item.get('priority', 'Unknown')
-        sta = item.get('status', 'Unknown')
-        ctx = item.get('context', 'Unknown')
-        
-        stats['by_category'][cat] = stats['by_category'].get(cat, 0) + 1
-        stats['by_priority'][pri] = stats['by_priority'].get(pri, 0) + 1
-        stats['by_status'][sta] = stats['by_status'].get(sta, 0) + 1
-        stats['by_context'][ctx] = stats['by_context'].get(ctx, 0) + 1
+    if item is not None:
+        return jsonify({**parsed, 'success': True, 'item': item})
     
-    return jsonify(stats)
+    return jsonify({**parsed, 'success': False, 'error': 'Item not found'}), 404
+
+@bp.route('/api/parse/batch', methods=['POST'])
+def parse_batch_input():
+    texts, error = _batch_texts(request.json)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+    return jsonify({'success': True, 'results': parse_batch(texts)})
+
+@bp.route('/api/search', methods=['GET'])
+def search_items():
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', 50, type=int)
+    get_store()
+    return jsonify(_search.search(query, limit))
 
-@app.route('/api/export', methods=['GET'])
+@bp.route('/api/duplicates', methods=['GET'])
+def get_duplicates():
+    """Clusters of open items with near-identical titles, e.g. ?threshold=0.8"""
+    threshold = request.args.get('threshold', DUPLICATE_THRESHOLD, type=float)
+    if not 0 < threshold <= 1:
+        return jsonify({'success': False, 'error': 'threshold must be in (0, 1]'}), 400
+    get_store()
+    clusters = _duplicates.clusters(threshold)
+    return jsonify({'threshold': threshold, 'clusters': clusters})
+
+@bp.route('/api/changes', methods=['GET'])
+def get_changes():
+    """Items upserted and ids deleted since a version: ?since=<version from the last sync>
+
+    Without since, or when the change log no longer reaches back that far, the response
+    is a reset listing every item.
+    """
+    since = request.args.get('since', type=int)
+    return jsonify(get_store().changes_since(since))
+
+@bp.route('/api/changes', methods=['POST'])
+def push_changes():
+    """Apply a client's changes in one commit, then return what changed since its version
+
+    {"since": <version>, "changes": [{"op": "upsert", "item": {...}}, {"op": "delete", "id": N}]}
+    """
+    data = request.json
+    changes, error = _push_changes(data)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+    results = write(_apply_changes, changes)
+    since = data.get('since')
+    delta = get_store().changes_since(since if type(since) is int else None)
+    return jsonify({'success': True, 'results': results, **delta})
+
+@bp.route('/api/stream', methods=['GET'])
+def stream_changes():
+    """Server-Sent Events: the change feed as it advances (see stream.py)
+
+    Resumes from the Last-Event-ID header a reconnecting EventSource sends, or ?since=.
+    """
+    since = request.headers.get('Last-Event-ID', request.args.get('since'))
+    try:
+        since = int(since) if since else None
+    except ValueError:
+        return jsonify({'success': False, 'error': 'since must be a version number'}), 400
+    get_store()
+    if _stream.full():
+        return jsonify({'success': False, 'error': 'Too many open streams'}), 503
+    response = current_app.response_class(_stream.events(since), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # nginx: don't buffer the stream
+    return response
+
+@bp.route('/api/stats', methods=['GET'])
+def get_stats():
+    since = request.args.get('since', type=int)
+    get_store()
+    if since is not None:
+        return jsonify(_stats.since(since))
+    return jsonify(_stats.stats())
+
+@bp.route('/api/export', methods=['GET'])
 def export_data():
-    """Re-generate Excel file with current data"""
-    items = load_data()
-    
-    # Save to gtd_data.py format and regenerate Excel
-    import pandas as pd
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-    
-    df = pd.DataFrame(items)
-    df.columns = ['Item', 'Category', 'Project/Area', 'Context', 'Next Action', 'Waiting For', 
-                  'Someday/Maybe', 'Priority', 'Status', 'Energy', 'Time Required', 'Due Date', 
-                  'Delegated To', 'Notes']
-    
-    output_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'Shreyas_GTD_Master.xlsx')
-    
-    # Simple export
-    df.to_excel(output_path, index=False)
-    
-    return jsonify({'success': True, 'path': output_path, 'count': len(items)})
+    """Download every item as Excel (default) or ?format=csv, streamed from the store"""
+    fmt = request.args.get('format', 'xlsx')
+    items = get_store().iter_all()
+    if fmt == 'csv':
+        response = current_app.response_class(iter_csv(items), mimetype='text/csv')
+        response.headers['Content-Disposition'] = f'attachment; filename={EXPORT_NAME}.csv'
+        return response
+    if fmt != 'xlsx':
+        return jsonify({'success': False, 'error': f'Unknown export format: {fmt}'}), 400
+    return send_file(xlsx_file(items), as_attachment=True, download_name=f'{EXPORT_NAME}.xlsx',
+                     mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+
+@bp.route('/api/export', methods=['POST'])
+def start_export():
+    """Queue a build of the formatted workbook; poll the returned job, then download it"""
+    get_store()
+    job = _exports.submit()
+    return jsonify({'success': True, 'job': job}), 202
+
+@bp.route('/api/export/jobs/<job_id>', methods=['GET'])
+def export_status(job_id):
+    get_store()
+    job = _exports.status(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Export job not found'}), 404
+    return jsonify(job)
+
+@bp.route('/api/export/jobs/<job_id>/download', methods=['GET'])
+def export_download(job_id):
+    get_store()
+    job = _exports.status(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Export job not found'}), 404
+    path = _exports.artifact(job_id)
+    if path is None:
+        if job['status'] == 'done':
+            return jsonify({'success': False, 'error': 'Export expired, start a new one'}), 410
+        return jsonify({'success': False, 'error': f"Export is {job['status']}"}), 409
+    return send_file(path, as_attachment=True, download_name=f'{EXPORT_NAME}.xlsx')
+
+@bp.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Request, store, file and parser metrics in the Prometheus text format"""
+    return current_app.response_class(REGISTRY.render(), content_type=CONTENT_TYPE)
+
+def _start_request():
+    g.started = time.perf_counter()
+    g.profile = _profiler.start()
+
+def _finish_request(response):
+    """Record the request's latency (a streamed body is timed until its handler returns)"""
+    elapsed = time.perf_counter() - g.started
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    REQUESTS.inc(method=request.method, route=route, status=response.status_code)
+    REQUEST_SECONDS.observe(elapsed, method=request.method, route=route)
+    if g.profile:
+        _profiler.finish(g.profile, f'{request.method} {route}', elapsed)
+    return response
+
+def create_app():
+    """The Flask app (WSGI entry point: gunicorn 'server:create_app()')
+
+    Nothing heavy happens here: the store is opened, and openpyxl, the workbook
+    builder and the parser vocabulary are loaded, on first use.
+    """
+    app = Flask(__name__)
+    CORS(app)
+    app.register_blueprint(bp)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    return app
 
 if __name__ == '__main__':
-    init_data()
+    get_store()
     print("🚀 GTD Voice App starting...")
     print("📍 Open http://localhost:5050 in your browser")
-    app.run(host='0.0.0.0', port=5050, debug=True)
+    create_app().run(host='0.0.0.0', port=5050, debug=os.environ.get('GTD_DEBUG') == '1')
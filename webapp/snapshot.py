@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Snapshot file formats for the JSON store
+
+Two formats, told apart by their first bytes on load:
+    json      the pretty-printed list of items (``indent=2``), readable and diffable
+    compact   MAGIC + zlib-compressed columns: items are split into one column per key,
+              and columns with few distinct values (status, context, priority, ...) are
+              stored as a value dictionary plus one packed integer code per item
+
+Inside the zlib stream of a compact snapshot: a little-endian uint32 header length,
+the JSON header, then the code arrays of the dictionary columns, in header order.
+    {"count": N,
+     "shapes": [[key, ...], ...],               distinct key lists, in first-seen order
+     "shape": <column>,                         index into shapes, per item
+     "columns": {key: <column>, ...}}           values of every item that has the key
+    <column> is {"values": [...]} or {"dict": [...], "codes": <array typecode>, "count": N}
+
+Convert an existing file (in place, or to a new path):
+    python snapshot.py compact gtd_data.json [output]
+    python snapshot.py json gtd_data.json [output]
+"""
+
+import io
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+MAGIC = b'GTDC\x01'
+FORMATS = ('json', 'compact')
+
+# Array typecodes for dictionary codes, smallest first
+CODE_TYPES = ('B', 'H', 'I', 'Q')
+
+# Dictionary-encode a column when it has at most this share of distinct values
+DICTIONARY_SHARE = 0.5
+
+
+def detect(data):
+    """Format of a snapshot's bytes: 'compact' or 'json'"""
+    return 'compact' if data[:len(MAGIC)] == MAGIC else 'json'
+
+
+def _typecode(size):
+    return next(code for code in CODE_TYPES if size <= 1 << (8 * array(code).itemsize))
+
+
+def _column(values, blobs):
+    try:
+        # Keyed by type too: 1, True and 1.0 are equal keys but must decode as themselves
+        distinct = {}
+        codes = [distinct.setdefault((type(value), value), len(distinct)) for value in values]
+    except TypeError:  # unhashable values (lists, dicts) stay plain
+        return {'values': values}
+    if len(distinct) > len(values) * DICTIONARY_SHARE:
+        return {'values': values}
+    codes = array(_typecode(len(distinct)), codes)
+    if sys.byteorder == 'big':
+        codes.byteswap()
+    blobs.append(codes.tobytes())
+    return {'dict': [value for _, value in distinct], 'codes': codes.typecode, 'count': len(values)}
+
+
+def _values(column, blob):
+    if 'codes' not in column:
+        return column['values']
+    codes = array(column['codes'])
+    size = codes.itemsize * column['count']
+    codes.frombytes(blob.read(size))
+    if sys.byteorder == 'big':
+        codes.byteswap()
+    return list(map(column['dict'].__getitem__, codes))
+
+
+def encode_compact(items):
+    shapes = {}
+    shape = []
+    columns = {}
+    for item in items:
+        keys = tuple(item)
+        shape.append(shapes.setdefault(keys, len(shapes)))
+        for key in keys:
+            columns.setdefault(key, []).append(item[key])
+    blobs = []
+    header = {'count': len(items), 'shapes': [list(keys) for keys in shapes],
+              'shape': _column(shape, blobs), 'columns': {}}
+    for key, values in columns.items():
+        header['columns'][key] = _column(values, blobs)
+    header = json.dumps(header, separators=(',', ':')).encode()
+    return MAGIC + zlib.compress(struct.pack('<I', len(header)) + header + b''.join(blobs), 6)
+
+
+def decode_compact(data):
+    body = zlib.decompress(data[len(MAGIC):])
+    size, = struct.unpack_from('<I', body)
+    header = json.loads(body[4:4 + size])
+    blob = io.BytesIO(body[4 + size:])
+    shape = _values(header['shape'], blob)
+    shapes = header['shapes']
+    columns = {key: iter(_values(column, blob)) for key, column in header['columns'].items()}
+    if len(shapes) == 1:
+        keys = shapes[0]
+        return [dict(zip(keys, row)) for row in zip(*(columns[key] for key in keys))]
+    # Items of several shapes: each pulls the next value from the columns of its keys
+    readers = [(keys, [columns[key] for key in keys]) for keys in shapes]
+    items = []
+    for index in shape:
+        keys, iterators = readers[index]
+        items.append(dict(zip(keys, map(next, iterators))))
+    return items
+
+
+def dumps(items, format='json'):
+    """Snapshot bytes for a list of items"""
+    if format == 'compact':
+        return encode_compact(items)
+    if format == 'json':
+        return json.dumps(items, indent=2).encode()
+    raise ValueError(f"Unknown snapshot format: {format}")
+
+
+def loads(data):
+    """Items from snapshot bytes of either format"""
+    if detect(data) == 'compact':
+        return decode_compact(data)
+    return json.loads(data)
+
+
+def load(path):
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def convert(path, format, output=None):
+    """Rewrite a snapshot in another format; returns (old size, new size)
+
+    In place, this is safe while the app runs: under the store lock, the new snapshot is
+    swapped in like a compaction that folds no ops, so the journal moves over to it.
+    """
+    from journal import Journal, atomic_write
+    from writer import FileLock
+    if output and output != path:
+        with open(path, 'rb') as f:
+            data = f.read()
+        converted = dumps(loads(data), format)
+        atomic_write(output, converted)
+        return len(data), len(converted)
+    with FileLock(f'{path}.lock').hold():
+        journal = Journal(path)
+        items, _ = journal.load()
+        before = os.path.getsize(path)
+        converted = dumps(items, format)
+        tmp, digest = journal.write_snapshot(converted)
+        journal.commit_snapshot(tmp, digest, journal.base_seq, 0, journal.meta)
+    return before, len(converted)
+
+
+def main(argv):
+    if len(argv) not in (2, 3) or argv[0] not in FORMATS:
+        print('Usage: python snapshot.py compact|json <snapshot> [output]')
+        return 2
+    format, path = argv[0], argv[1]
+    output = argv[2] if len(argv) > 2 else path
+    before, after = convert(path, format, output)
+    print(f"✅ {output}: {format}, {before:,} → {after:,} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
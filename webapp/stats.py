@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Incrementally maintained item statistics"""
+
+from collections import deque
+
+from cache import DerivedIndex
+
+# Stats group -> item field it counts
+GROUPS = {
+    'by_category': 'category',
+    'by_priority': 'priority',
+    'by_status': 'status',
+    'by_context': 'context',
+    'by_project': 'project',
+}
+
+# How many commits of deltas to keep for ?since= requests
+HISTORY = 1000
+
+
+def _bump(counts, key, n):
+    counts[key] = counts.get(key, 0) + n
+    if not counts[key]:
+        del counts[key]
+
+
+class StatsIndex(DerivedIndex):
+    """Per-field counters updated on every commit, plus a short history of deltas"""
+
+    def rebuild(self, items):
+        self.rows = {}  # item_id -> (group values..., completed)
+        self.counts = {group: {} for group in GROUPS}
+        self.counts['total'] = self.counts['open'] = self.counts['completed'] = 0
+        self._history = deque(maxlen=HISTORY)  # (from_version, to_version, delta), contiguous
+        for item in items:
+            self._set(item['id'], item, {})
+
+    def _set(self, item_id, item, delta):
+        # Replace the item's contribution to every counter, recording the change in delta
+        old = self.rows.pop(item_id, None)
+        new = None
+        if item is not None:
+            values = tuple(item.get(field, 'Unknown') for field in GROUPS.values())
+            new = values + (item.get('status') == 'Completed',)
+            self.rows[item_id] = new
+        for row, sign in ((old, -1), (new, 1)):
+            if row is None:
+                continue
+            for group, value in zip(GROUPS, row):
+                _bump(self.counts[group], value, sign)
+                _bump(delta.setdefault(group, {}), value, sign)
+            for key in ('total', 'completed' if row[-1] else 'open'):
+                self.counts[key] += sign
+                delta[key] = delta.get(key, 0) + sign
+
+    def apply(self, changes):
+        delta = {}
+        for kind, item in changes:
+            self._set(item['id'], item if kind == 'upsert' else None, delta)
+        self._delta = delta
+
+    def _on_commit(self, changes, before, after):
+        with self._lock:
+            self._delta = None
+            super()._on_commit(changes, before, after)
+            if self._delta is not None and self._signature == after:
+                self._history.append((self.store.version_of(before), self.store.version_of(after),
+                                      {k: v for k, v in self._delta.items() if v}))
+
+    def _snapshot(self):
+        stats = {group: dict(counts) if isinstance(counts, dict) else counts
+                 for group, counts in self.counts.items()}
+        stats['version'] = self.store.version_of(self._signature)
+        return stats
+
+    def stats(self):
+        """Current counters (O(groups), no pass over the items)"""
+        self.current()
+        with self._lock:
+            return self._snapshot()
+
+    def since(self, version):
+        """Summed counter deltas since version, or full stats if that is no longer covered"""
+        self.current()
+        with self._lock:
+            now = self.store.version_of(self._signature)
+            oldest = self._history[0][0] if self._history else now
+            if not oldest <= version <= now:
+                return {**self._snapshot(), 'full': True}
+            delta = {}
+            for start, _, change in self._history:
+                if start < version:
+                    continue
+                for key, value in change.items():
+                    if isinstance(value, dict):
+                        for name, n in value.items():
+                            _bump(delta.setdefault(key, {}), name, n)
+                    else:
+                        delta[key] = delta.get(key, 0) + value
+            return {'full': False, 'since': version, 'version': now,
+                    'delta': {k: v for k, v in delta.items() if v}}
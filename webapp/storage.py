@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Item storage backends"""
+
+import contextlib
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import deque
+
+import snapshot
+from journal import Journal, atomic_write
+from metrics import counter
+from writer import FileLock
+
+# Item schema, in the order items are serialized (matches gtd_data.py)
+FIELDS = ['item', 'category', 'project', 'context', 'next_action', 'waiting_for', 'someday',
+          'priority', 'status', 'energy', 'time', 'due', 'delegated', 'notes']
+
+# Column indexes earlier versions created; views filter in memory (views.ViewIndex), so
+# they only slowed writes down
+DROPPED_INDEXES = ['idx_items_status', 'idx_items_priority', 'idx_items_context',
+                   'idx_items_project', 'idx_items_category']
+
+# Versions of history kept for changes_since(); older clients get the full list instead
+CHANGE_LOG_SIZE = 10000
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Where gtd_data.json / gtd_data.db live (GTD_DATA_DIR moves them, e.g. for benchmarks)
+DATA_DIR = os.environ.get('GTD_DATA_DIR', BASE_DIR)
+DATA_FILE = os.path.join(DATA_DIR, 'gtd_data.json')
+DB_FILE = os.path.join(DATA_DIR, 'gtd_data.db')
+
+
+LOADS = counter('gtd_store_loads_total', 'Reads of every item from the store', ['backend'])
+SAVES = counter('gtd_store_saves_total', 'Committed write transactions', ['backend'])
+COMPACTIONS = counter('gtd_store_compactions_total', 'Journal compactions into gtd_data.json')
+
+
+def seed_items(json_path=DATA_FILE):
+    """Items used to populate a new store: the legacy JSON file, else gtd_data.py"""
+    if os.path.exists(json_path):
+        return snapshot.load(json_path)
+    sys.path.insert(0, os.path.dirname(BASE_DIR))
+    from gtd_data import gtd_items
+    return gtd_items
+
+
+class Store:
+    """Change notification shared by the backends"""
+
+    def subscribe(self, fn):
+        """Call fn(changes, before, after) after every committed transaction, where changes
+        is a list of ('upsert', item) / ('delete', item) and before/after are signatures"""
+        self._listeners.append(fn)
+
+    def _emit(self, changes, before, after):
+        for fn in self._listeners:
+            fn(changes, before, after)
+
+    def version_of(self, signature):
+        """The version a signature stands for (both backends use the version itself)"""
+        return signature
+
+    def version(self):
+        """Monotonic counter that advances once per committed op, across processes"""
+        return self.version_of(self.signature())
+
+    def iter_all(self, batch_size=500):
+        """Items in id order, for callers that stream them (the JSON store holds them in memory anyway)"""
+        return iter(self.all())
+
+    def add_many(self, items):
+        """Add several items in one transaction; returns them with their ids"""
+        with self.transaction():
+            return [self.add(item) for item in items]
+
+    def _delta(self, current, changed, items):
+        # changed: ids touched after version (None if the log doesn't reach back that far);
+        # items: their current state, or every item for a reset
+        if changed is None:
+            return {'version': current, 'reset': True, 'upserts': items, 'deletes': []}
+        found = {item['id'] for item in items}
+        return {'version': current, 'reset': False, 'upserts': items,
+                'deletes': sorted(item_id for item_id in changed if item_id not in found)}
+
+
+class JSONStore(Store):
+    """gtd_data.json snapshot plus an append-only journal of mutations since the last compaction
+
+    Compactions write the snapshot in snapshot_format ('json' or 'compact', default
+    GTD_SNAPSHOT_FORMAT); when neither is set, they keep the format of the file on disk.
+    """
+
+    def __init__(self, path=DATA_FILE, compact_every=500, compact_interval=60, snapshot_format=None):
+        self.path = path
+        self.snapshot_format = snapshot_format or os.environ.get('GTD_SNAPSHOT_FORMAT')
+        self._listeners = []
+        self._changes = None
+        self._feed = None
+        self.compact_every = compact_every
+        self.compact_interval = compact_interval
+        if not os.path.exists(path):
+            atomic_write(path, snapshot.dumps(seed_items(path), self.snapshot_format or 'json'))
+        # _lock serializes threads in this process, _file_lock serializes processes
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(f'{path}.lock')
+        self._depth = 0
+        self.journal = Journal(path)
+        with self._file_lock.hold():
+            self._reload()
+        self._compact_needed = threading.Event()
+        threading.Thread(target=self._compactor, name='gtd-compactor', daemon=True).start()
+
+    def _reload(self):
+        LOADS.inc(backend='json')
+        seen = self.journal.seq
+        items, ops = self.journal.load()
+        if self._feed is None or seen < self.journal.base_seq:
+            # The new snapshot holds ops we never saw, so their ids can't be listed
+            self._feed = deque(maxlen=CHANGE_LOG_SIZE)  # (seq, item_id) per op
+            self._feed_floor = self.journal.base_seq
+        # Items are kept in an insertion-ordered dict keyed by id: O(1) lookup and delete
+        self.items = {}
+        self.next_id = max([self.journal.meta.get('next_id', 1)] +
+                           [item['id'] + 1 for item in items if 'id' in item])
+        for item in items:
+            if 'id' not in item:
+                # Snapshots from before ids existed; numbering is deterministic across processes
+                item = {'id': self.next_id, **item}
+                self.next_id += 1
+            self.items[item['id']] = item
+        for op in ops:
+            self._apply(op)
+
+    def _sync(self):
+        """Pick up ops journaled by other processes; True if the journal was replaced"""
+        ops = self.journal.read_tail()
+        if ops is None:
+            self._reload()
+            return True
+        for op in ops:
+            self._apply(op)
+        return False
+
+    def _refresh(self):
+        # Writers hold the exclusive lock, so under the shared lock the journal is consistent
+        if not self._depth:
+            with self._file_lock.hold(exclusive=False):
+                self._sync()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Exclusive write section; journal appends inside it share one write + fsync"""
+        # Listeners run after the locks are released, so they may read from the store
+        with self._lock:
+            outer = not self._depth
+            with self._file_lock.hold() if outer else contextlib.nullcontext():
+                if outer:
+                    self._sync()
+                    before = self._signature()
+                    self.journal.begin()
+                    self._changes = []
+                self._depth += 1
+                try:
+                    yield self
+                finally:
+                    self._depth -= 1
+                    if outer:
+                        self.journal.commit()
+                        changes, self._changes = self._changes, None
+                        if changes:
+                            SAVES.inc(backend='json')
+                        after = self._signature()
+                        if self.journal.pending >= self.compact_every:
+                            self._compact_needed.set()
+        if outer and changes:
+            self._emit(changes, before, after)
+
+    def _apply(self, op):
+        # Item dicts are replaced, never mutated, so lists handed out by all() stay consistent
+        item = self._apply_op(op)
+        if not self._feed or op['seq'] > self._feed[-1][0]:
+            if len(self._feed) == self._feed.maxlen:
+                self._feed_floor = self._feed[0][0]
+            self._feed.append((op['seq'], item['id']))
+        return item
+
+    def _apply_op(self, op):
+        if op['op'] == 'add':
+            item = op['item']
+            if 'id' not in item:
+                item = {'id': self.next_id, **item}
+            self.items[item['id']] = item
+            self.next_id = max(self.next_id, item['id'] + 1)
+            return item
+        # Journals written before ids existed address items by position
+        item_id = op['id'] if 'id' in op else next(itertools.islice(self.items, op['index'], None))
+        if op['op'] == 'update':
+            item = {**self.items[item_id], **op['data'], 'id': item_id}
+            self.items[item_id] = item
+            return item
+        if op['op'] == 'delete':
+            return self.items.pop(item_id)
+
+    def _write(self, op):
+        old = self.items.get(op.get('id'))
+        item = self._apply(self.journal.append(op))
+        self._changes.append(('delete', old) if op['op'] == 'delete' else ('upsert', item))
+        return item
+
+    def _compactor(self):
+        # Compact once enough ops pile up, or periodically while any are pending
+        while True:
+            self._compact_needed.wait(self.compact_interval)
+            self._compact_needed.clear()
+            self.compact()
+
+    def compact(self):
+        """Fold the journal into a fresh snapshot (temp file + rename)"""
+        with self._lock:
+            self._refresh()
+            if not self.journal.pending:
+                return
+            items, seq, offset = list(self.items.values()), self.journal.seq, self.journal.offset
+            identity = self.journal.identity
+            meta = {'next_id': self.next_id}
+            format = self.snapshot_format or self.journal.format
+        # Serialize and write outside the locks; writes keep appending to the journal meanwhile
+        tmp, digest = self.journal.write_snapshot(snapshot.dumps(items, format))
+        with self._lock, self._file_lock.hold():
+            # offset is only meaningful in the log it was read from
+            if self._sync() or self.journal.identity != identity:
+                os.remove(tmp)  # another process compacted first
+                return
+            self.journal.commit_snapshot(tmp, digest, seq, offset, meta)
+        COMPACTIONS.inc()
+
+    def _signature(self):
+        return self.journal.seq
+
+    def signature(self):
+        """Journal seq; advances on writes from this or any other process, and carries on
+        across compactions, so folding the journal doesn't invalidate derived state"""
+        with self._lock:
+            self._refresh()
+            return self._signature()
+
+    def all(self):
+        with self._lock:
+            self._refresh()
+            return list(self.items.values())
+
+    def changes_since(self, version):
+        """Items upserted and ids deleted after version, from the in-memory feed of journal ops:
+        {'version', 'reset', 'upserts', 'deletes'}; a reset lists every item"""
+        with self._lock:
+            self._refresh()
+            current = self.journal.seq
+            if version is None or not self._feed_floor <= version <= current:
+                return self._delta(current, None, list(self.items.values()))
+            changed = set()
+            for seq, item_id in reversed(self._feed):
+                if seq <= version:
+                    break
+                changed.add(item_id)
+            items = [self.items[item_id] for item_id in sorted(changed) if item_id in self.items]
+            return self._delta(current, changed, items)
+
+    def count(self):
+        with self._lock:
+            self._refresh()
+            return len(self.items)
+
+    def id_at(self, index):
+        """Id of the item at a list position (legacy positional routes); O(index)"""
+        with self._lock:
+            self._refresh()
+            if 0 <= index < len(self.items):
+                return next(itertools.islice(self.items, index, None))
+            return None
+
+    def get(self, item_id):
+        with self._lock:
+            self._refresh()
+            return self.items.get(item_id)
+
+    def add(self, item):
+        with self.transaction():
+            item = {k: v for k, v in item.items() if k != 'id'}
+            return self._write({'op': 'add', 'item': {'id': self.next_id, **item}})
+
+    def update(self, item_id, data):
+        with self.transaction():
+            if item_id not in self.items:
+                return None
+            data = {k: v for k, v in data.items() if k != 'id'}
+            return self._write({'op': 'update', 'id': item_id, 'data': data})
+
+    def delete(self, item_id):
+        with self.transaction():
+            if item_id not in self.items:
+                return None
+            return self._write({'op': 'delete', 'id': item_id})
+
+
+class SQLiteStore(Store):
+    """SQLite storage: one row per item, keyed by id"""
+
+    def __init__(self, path=DB_FILE, seed_path=DATA_FILE):
+        self.path = path
+        self._listeners = []
+        self._local = threading.local()
+        self._create_schema(self._conn())
+        with self.transaction() as conn:
+            if conn.execute("SELECT value FROM meta WHERE key = 'seeded'").fetchone() is None:
+                self._insert(conn, seed_items(seed_path))
+                conn.execute("INSERT INTO meta (key, value) VALUES ('seeded', 1)")
+
+    def _conn(self):
+        # sqlite3 connections can't be shared across threads; keep one per thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode: transaction() issues BEGIN/COMMIT itself
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """One COMMIT for everything inside; nested calls become savepoints"""
+        conn = self._conn()
+        depth = self._local.depth
+        if depth == 0:
+            # IMMEDIATE takes the write lock up front, serializing writers across processes
+            conn.execute('BEGIN IMMEDIATE')
+            before = self._generation(conn)
+            self._local.changes = []
+        else:
+            conn.execute(f'SAVEPOINT sp{depth}')
+        mark = len(self._local.changes)
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            if depth == 0:
+                conn.execute('ROLLBACK')
+            else:
+                conn.execute(f'ROLLBACK TO sp{depth}')
+                conn.execute(f'RELEASE sp{depth}')
+            del self._local.changes[mark:]
+            raise
+        else:
+            if depth == 0:
+                after = self._generation(conn)
+                conn.execute('COMMIT')
+                if self._local.changes:
+                    SAVES.inc(backend='sqlite')
+            else:
+                conn.execute(f'RELEASE sp{depth}')
+        finally:
+            self._local.depth = depth
+        if depth == 0 and self._local.changes:
+            changes, self._local.changes = self._local.changes, []
+            self._emit(changes, before, after)
+
+    def _create_schema(self, conn):
+        columns = ', '.join(f"{field} TEXT NOT NULL DEFAULT ''" for field in FIELDS)
+        conn.execute(f'CREATE TABLE IF NOT EXISTS items '
+                     f'(id INTEGER PRIMARY KEY AUTOINCREMENT, {columns}, extra TEXT)')
+        for name in DROPPED_INDEXES:
+            conn.execute(f'DROP INDEX IF EXISTS {name}')
+        conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)')
+        # One row per generation: the item it touched, for changes_since()
+        conn.execute('CREATE TABLE IF NOT EXISTS changes (version INTEGER PRIMARY KEY, item_id INTEGER NOT NULL)')
+        # Generations up to changes_floor have no rows (before the table existed, or pruned)
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) SELECT 'changes_floor', "
+                     "COALESCE((SELECT value FROM meta WHERE key = 'generation'), 0)")
+
+    def _generation(self, conn):
+        row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        return row['value'] if row else 0
+
+    def _bump(self, conn, item_ids):
+        # Every write advances the generation counter, and logs the items it touched
+        conn.execute("INSERT INTO meta (key, value) VALUES ('generation', ?) "
+                     "ON CONFLICT (key) DO UPDATE SET value = value + excluded.value", (len(item_ids),))
+        generation = self._generation(conn)
+        start = generation - len(item_ids) + 1
+        conn.executemany('INSERT INTO changes (version, item_id) VALUES (?, ?)',
+                         enumerate(item_ids, start))
+        floor = generation - CHANGE_LOG_SIZE
+        # Prune whenever the generation passes a multiple of 100
+        if floor > 0 and generation // 100 != (start - 1) // 100:
+            conn.execute('DELETE FROM changes WHERE version <= ?', (floor,))
+            conn.execute("UPDATE meta SET value = MAX(value, ?) WHERE key = 'changes_floor'", (floor,))
+
+    def _to_row(self, item):
+        row = [str(item.get(field) or '') for field in FIELDS]
+        extra = {k: v for k, v in item.items() if k not in FIELDS and k != 'id'}
+        row.append(json.dumps(extra) if extra else None)
+        return row
+
+    def _to_item(self, row):
+        item = {'id': row['id']}
+        item.update((field, row[field]) for field in FIELDS)
+        if row['extra']:
+            item.update(json.loads(row['extra']))
+        return item
+
+    def _insert(self, conn, items):
+        # Keep ids the items already have (e.g. seeding from a JSON-store snapshot)
+        placeholders = ', '.join('?' * (len(FIELDS) + 2))
+        conn.executemany(f"INSERT INTO items (id, {', '.join(FIELDS)}, extra) VALUES ({placeholders})",
+                         [[item.get('id')] + self._to_row(item) for item in items])
+
+    def _get(self, conn, item_id):
+        row = conn.execute('SELECT * FROM items WHERE id = ?', (item_id,)).fetchone()
+        return self._to_item(row) if row else None
+
+    def signature(self):
+        """Generation counter, bumped by every committed write from any process"""
+        return self._generation(self._conn())
+
+    def all(self):
+        LOADS.inc(backend='sqlite')
+        rows = self._conn().execute('SELECT * FROM items ORDER BY id').fetchall()
+        return [self._to_item(row) for row in rows]
+
+    def changes_since(self, version):
+        """Items upserted and ids deleted after version, from the changes table:
+        {'version', 'reset', 'upserts', 'deletes'}; a reset lists every item"""
+        conn = self._conn()
+        # A read transaction, so the version, the log and the items agree
+        conn.execute('BEGIN')
+        try:
+            current = self._generation(conn)
+            floor = conn.execute("SELECT value FROM meta WHERE key = 'changes_floor'").fetchone()['value']
+            if version is None or not floor <= version <= current:
+                LOADS.inc(backend='sqlite')
+                rows = conn.execute('SELECT * FROM items ORDER BY id').fetchall()
+                return self._delta(current, None, [self._to_item(row) for row in rows])
+            changed = {row[0] for row in conn.execute('SELECT DISTINCT item_id FROM changes WHERE version > ?',
+                                                      (version,))}
+            rows = conn.execute('SELECT * FROM items WHERE id IN (SELECT item_id FROM changes WHERE version > ?) '
+                                'ORDER BY id', (version,)).fetchall()
+            return self._delta(current, changed, [self._to_item(row) for row in rows])
+        finally:
+            conn.execute('COMMIT')
+
+    def iter_all(self, batch_size=500):
+        # Keyset batches: memory stays flat and no read transaction is held between them
+        LOADS.inc(backend='sqlite')
+        last_id = 0
+        while True:
+            rows = self._conn().execute('SELECT * FROM items WHERE id > ? ORDER BY id LIMIT ?',
+                                        (last_id, batch_size)).fetchall()
+            for row in rows:
+                yield self._to_item(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]['id']
+
+    def count(self):
+        return self._conn().execute('SELECT COUNT(*) FROM items').fetchone()[0]
+
+    def id_at(self, index):
+        """Id of the item at a list position (legacy positional routes); O(index)"""
+        if index < 0:
+            return None
+        row = self._conn().execute('SELECT id FROM items ORDER BY id LIMIT 1 OFFSET ?', (index,)).fetchone()
+        return row['id'] if row else None
+
+    def get(self, item_id):
+        return self._get(self._conn(), item_id)
+
+    def add(self, item):
+        with self.transaction() as conn:
+            placeholders = ', '.join('?' * (len(FIELDS) + 1))
+            cursor = conn.execute(f"INSERT INTO items ({', '.join(FIELDS)}, extra) VALUES ({placeholders})",
+                                  self._to_row(item))
+            self._bump(conn, [cursor.lastrowid])
+            item = self._get(conn, cursor.lastrowid)
+            self._local.changes.append(('upsert', item))
+            return item
+
+    def add_many(self, items):
+        # One statement per row but no read-back, and a single generation bump
+        with self.transaction() as conn:
+            placeholders = ', '.join('?' * (len(FIELDS) + 1))
+            sql = f"INSERT INTO items ({', '.join(FIELDS)}, extra) VALUES ({placeholders})"
+            added = []
+            for item in items:
+                row = self._to_row(item)
+                cursor = conn.execute(sql, row)
+                item = {'id': cursor.lastrowid, **dict(zip(FIELDS, row))}
+                if row[-1]:
+                    item.update(json.loads(row[-1]))
+                added.append(item)
+            if added:
+                self._bump(conn, [item['id'] for item in added])
+            self._local.changes.extend(('upsert', item) for item in added)
+            return added
+
+    def update(self, item_id, data):
+        with self.transaction() as conn:
+            item = self._get(conn, item_id)
+            if item is None:
+                return None
+            item.update(data)
+            item['id'] = item_id
+            assignments = ', '.join(f'{field} = ?' for field in FIELDS)
+            conn.execute(f'UPDATE items SET {assignments}, extra = ? WHERE id = ?',
+                         self._to_row(item) + [item_id])
+            self._bump(conn, [item_id])
+            # Read back: the row stores text, so return what a later get() will see
+            item = self._get(conn, item_id)
+            self._local.changes.append(('upsert', item))
+        return item
+
+    def delete(self, item_id):
+        with self.transaction() as conn:
+            deleted = self._get(conn, item_id)
+            if deleted is None:
+                return None
+            conn.execute('DELETE FROM items WHERE id = ?', (item_id,))
+            self._bump(conn, [item_id])
+            self._local.changes.append(('delete', deleted))
+        return deleted
+
+
+BACKENDS = {
+    'sqlite': SQLiteStore,
+    'json': JSONStore,
+}
+
+
+def open_store(backend=None):
+    """Open the configured store (GTD_STORAGE=sqlite|json, default sqlite)"""
+    backend = backend or os.environ.get('GTD_STORAGE', 'sqlite')
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend}")
+    return BACKENDS[backend]()
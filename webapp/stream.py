@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Server-Sent Events stream of item changes
+
+Each client gets the store's change feed (changes_since) as it advances:
+    event: ready      {"version"}                               once, on connect: the
+                                                                version events start from
+    event: changes    {"version", "upserts": [...], "deletes"}  after each commit
+    event: reset      {"version"}                               the feed no longer reaches
+                                                                back to the client's version
+Event ids are store versions, so a reconnecting EventSource resumes through its
+Last-Event-ID header (or ?since=). Commits in this process wake the streams at once;
+commits from other processes are noticed within POLL_INTERVAL. A comment line goes out
+every HEARTBEAT seconds so proxies keep idle streams open and dead clients are dropped.
+"""
+
+import json
+import threading
+import time
+
+# Seconds between keep-alive comments on an idle stream
+HEARTBEAT = 15.0
+
+# Seconds between checks for commits made by other processes
+POLL_INTERVAL = 1.0
+
+# Milliseconds a browser waits before reconnecting
+RETRY_MS = 3000
+
+# Open streams per process; each one holds a worker thread
+MAX_STREAMS = 100
+
+
+def format_event(event, data, event_id=None):
+    """One SSE message"""
+    lines = [f'event: {event}']
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return '\n'.join(lines) + '\n\n'
+
+
+class ChangeStream:
+    """Wakes the open event streams on every commit"""
+
+    def __init__(self, store):
+        self.store = store
+        self._changed = threading.Condition()
+        self._commits = 0
+        self.open_streams = 0
+        store.subscribe(self._on_commit)
+
+    def _on_commit(self, changes, before, after):
+        with self._changed:
+            self._commits += 1
+            self._changed.notify_all()
+
+    def full(self):
+        return self.open_streams >= MAX_STREAMS
+
+    def events(self, since=None):
+        """Event stream for one client, from version since (default: the current version)"""
+        with self._changed:
+            self.open_streams += 1
+        try:
+            version = self.store.version() if since is None else since
+            yield f'retry: {RETRY_MS}\n\n'
+            yield format_event('ready', {'version': version}, version)
+            last_sent = time.monotonic()
+            while True:
+                commits = self._commits
+                if self.store.version() != version:
+                    delta = self.store.changes_since(version)
+                    version = delta['version']
+                    if delta['reset']:
+                        yield format_event('reset', {'version': version}, version)
+                    else:
+                        yield format_event('changes', {'version': version, 'upserts': delta['upserts'],
+                                                       'deletes': delta['deletes']}, version)
+                    last_sent = time.monotonic()
+                    continue
+                if time.monotonic() - last_sent >= HEARTBEAT:
+                    yield ': heartbeat\n\n'
+                    last_sent = time.monotonic()
+                with self._changed:
+                    self._changed.wait_for(lambda: self._commits != commits, POLL_INTERVAL)
+        finally:
+            with self._changed:
+                self.open_streams -= 1
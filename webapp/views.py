@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Filtered, sorted and paginated item views"""
+
+import base64
+import bisect
+import itertools
+import json
+
+from cache import DerivedIndex
+
+# Fields that can be filtered on by exact value
+FILTER_FIELDS = ['status', 'context', 'priority', 'project', 'category', 'energy']
+
+PRIORITY_ORDER = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+ENERGY_ORDER = {'High': 0, 'Medium': 1, 'Low': 2}
+
+
+def _ranked(field, order):
+    return lambda item: (order.get(item.get(field), len(order)),)
+
+
+def _text(field):
+    return lambda item: (str(item.get(field) or '').lower(),)
+
+
+# Sort name -> key function. Rows are (key..., id), so every item has a unique position.
+SORT_KEYS = {
+    'id': lambda item: (),
+    'priority': _ranked('priority', PRIORITY_ORDER),
+    'energy': _ranked('energy', ENERGY_ORDER),
+    'due': lambda item: (not item.get('due'), str(item.get('due') or '')),  # undated last
+    'item': _text('item'),
+    'status': _text('status'),
+    'context': _text('context'),
+    'project': _text('project'),
+    'category': _text('category'),
+}
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# When the filters leave fewer than this share of all items, the matches are sorted
+# directly; otherwise the maintained sort order is walked, skipping non-matches
+DIRECT_SORT_RATIO = 0.1
+
+
+def encode_cursor(sort, descending, row):
+    raw = json.dumps([sort, descending, list(row)], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, sort, descending):
+    """Row position from a cursor; ValueError if it's malformed or for another sort"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_sort, cursor_descending, row = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if cursor_sort != sort or cursor_descending != descending or not isinstance(row, list):
+        raise ValueError('Cursor belongs to a different sort order')
+    # Rows of a sort all have the shape of an empty item's: same length, same types
+    # (bool apart from int), so a forged cursor can't make bisect compare str with int
+    template = SORT_KEYS[sort]({}) + (0,)
+    if len(row) != len(template) or any(type(value) is not type(expected)
+                                        for value, expected in zip(row, template)):
+        raise ValueError('Invalid cursor')
+    return tuple(row)
+
+
+class ViewIndex(DerivedIndex):
+    """Value -> ids indexes on the filter fields plus sorted orders for the sort keys"""
+
+    def rebuild(self, items):
+        self.items = {}     # item_id -> item, as of its last commit
+        self.postings = {field: {} for field in FILTER_FIELDS}  # field -> value -> {item_id}
+        self.orders = {}    # sort name -> sorted rows, built on first use
+        for item in items:
+            self._add(item)
+
+    def apply(self, changes):
+        for kind, item in changes:
+            self._remove(item['id'])
+            if kind == 'upsert':
+                self._add(item)
+
+    def _row(self, sort, item):
+        return SORT_KEYS[sort](item) + (item['id'],)
+
+    def _add(self, item):
+        item = dict(item)  # keep the indexed values even if the caller's dict changes
+        self.items[item['id']] = item
+        for field in FILTER_FIELDS:
+            self.postings[field].setdefault(item.get(field, ''), set()).add(item['id'])
+        for sort, order in self.orders.items():
+            bisect.insort(order, self._row(sort, item))
+
+    def _remove(self, item_id):
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return
+        for field in FILTER_FIELDS:
+            value = item.get(field, '')
+            ids = self.postings[field][value]
+            ids.discard(item_id)
+            if not ids:
+                del self.postings[field][value]
+        for sort, order in self.orders.items():
+            row = self._row(sort, item)
+            i = bisect.bisect_left(order, row)
+            if i < len(order) and order[i] == row:
+                del order[i]
+
+    def _order(self, sort):
+        if sort not in self.orders:
+            self.orders[sort] = sorted(self._row(sort, item) for item in self.items.values())
+        return self.orders[sort]
+
+    def _matches(self, filters, due_from, due_to):
+        """Ids passing every filter, or None when nothing is filtered"""
+        matches = None
+        # Intersect starting from the most selective field
+        sets = [set().union(*(self.postings[field].get(v, ()) for v in values))
+                for field, values in filters.items()]
+        for ids in sorted(sets, key=len):
+            matches = ids if matches is None else matches & ids
+        if due_from or due_to:
+            candidates = self.items if matches is None else matches
+            matches = set()
+            for item_id in candidates:
+                # As text, like the SQLite rows: JSON-store items may hold other types
+                due = str(self.items[item_id].get('due') or '')
+                if due and (not due_from or due >= due_from) and (not due_to or due <= due_to):
+                    matches.add(item_id)
+        return matches
+
+    def query(self, filters=None, due_from=None, due_to=None, sort='id', descending=False,
+              cursor=None, limit=DEFAULT_LIMIT):
+        """One page of matching items: {items, next_cursor, total}
+
+        filters maps a field to the values it may have. due_from / due_to bound the due
+        date (compared as text, so use YYYY-MM-DD); undated items never match a range.
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f'Unknown sort key: {sort}')
+        unknown = set(filters or {}) - set(FILTER_FIELDS)
+        if unknown:
+            raise ValueError(f"Can't filter on: {', '.join(sorted(unknown))}")
+        after = decode_cursor(cursor, sort, descending) if cursor else None
+        limit = max(1, min(limit, MAX_LIMIT))
+
+        self.current()
+        with self._lock:
+            matches = self._matches(filters or {}, due_from, due_to)
+            total = len(self.items) if matches is None else len(matches)
+            if matches is not None and len(matches) < DIRECT_SORT_RATIO * len(self.items):
+                rows = sorted(self._row(sort, self.items[item_id]) for item_id in matches)
+                matches = None  # every row already matches
+            else:
+                rows = self._order(sort)
+
+            if descending:
+                end = bisect.bisect_left(rows, after) if after else len(rows)
+                walk = (rows[i] for i in range(end - 1, -1, -1))
+            else:
+                start = bisect.bisect_right(rows, after) if after else 0
+                walk = itertools.islice(rows, start, None)
+            page = []
+            for row in walk:
+                if matches is None or row[-1] in matches:
+                    page.append(row)
+                    if len(page) > limit:
+                        break
+
+            next_cursor = encode_cursor(sort, descending, page[limit - 1]) if len(page) > limit else None
+            return {
+                'items': [self.items[row[-1]] for row in page[:limit]],
+                'next_cursor': next_cursor,
+                'total': total,
+            }
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Voice input parser
+
+The keyword tables live in vocabulary.json. Each value lists its keywords, and where
+several values of one table match, the first one listed wins. The file is compiled
+once into a single regex and recompiled (then swapped in whole) when it changes, so
+accounts or contexts can be added without a restart.
+
+Parsing makes one pass over the text to collect all keyword hits, then resolves each
+attribute by the precedence of its table. Keywords match whole words (plus simple
+inflections such as "calls" or "planning"), so 'ai' no longer fires inside "email".
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+from metrics import PARSE_BUCKETS, histogram
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+VOCABULARY_FILE = os.environ.get('GTD_VOCABULARY', os.path.join(BASE_DIR, 'vocabulary.json'))
+
+# How often (seconds) parse_voice_input looks for edits to the vocabulary file
+RELOAD_INTERVAL = 1.0
+
+PARSE_SECONDS = histogram('gtd_parse_duration_seconds', 'Time to parse one utterance', buckets=PARSE_BUCKETS)
+
+
+def _inflections(phrase):
+    """The phrase plus simple inflections of its last word (calls, planning, shopped, ...)"""
+    forms = {phrase, phrase + 's', phrase + 'es', phrase + 'ing', phrase + 'ed'}
+    last = phrase[-1]
+    if last == 'e':
+        forms |= {phrase + 'd', phrase[:-1] + 'ing'}
+    elif last not in 'aeiouy':
+        forms |= {phrase + last + 'ing', phrase + last + 'ed'}
+    return forms
+
+
+def _trie_pattern(words):
+    """Alternation regex for words, factored into a trie so a match attempt costs
+    about the length of the text at that point rather than the vocabulary size"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: longer keywords are tried before their prefixes
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class Vocabulary:
+    """Keyword tables compiled into one matcher"""
+
+    def __init__(self, tables, actions, cleanup_words, professional_accounts):
+        # table name -> {value: rank}, to resolve several hits in one table
+        self.ranks = {name: {value: rank for rank, value in enumerate(values)}
+                      for name, values in tables.items()}
+        self.professional_accounts = set(professional_accounts)
+
+        hits = {}
+        for name, values in tables.items():
+            for value, keywords in values.items():
+                if not isinstance(keywords, list) or not all(isinstance(k, str) and k.strip() for k in keywords):
+                    raise ValueError(f'{name} / {value}: keywords must be a list of non-empty strings')
+                for keyword in keywords:
+                    hits.setdefault(keyword.strip().lower(), set()).add((name, value))
+        # A keyword also counts as any shorter keyword it starts with ('riyadh air' -> 'riyadh')
+        for phrase in hits:
+            for other in hits:
+                if phrase.startswith(other + ' '):
+                    hits[phrase] |= hits[other]
+        self.hits = {}
+        for phrase, phrase_hits in hits.items():
+            for form in _inflections(phrase):
+                self.hits.setdefault(form, set()).update(phrase_hits)
+
+        # Zero-width lookahead so keywords starting inside another match ('business plan'
+        # then 'plan') are still found in the same single pass
+        self.keyword_re = re.compile(r'(?=\b(' + _trie_pattern(self.hits) + r')\b)')
+
+        self.actions = {keyword: action for action, keywords in actions.items() for keyword in keywords}
+        self.action_re = re.compile(r'^(' + _trie_pattern(self.actions) + r')\s+', re.IGNORECASE)
+        self.cleanup_re = re.compile(r'\b(' + _trie_pattern(cleanup_words) + r')\b', re.IGNORECASE)
+
+    def scan(self, text_lower):
+        """table name -> best-ranked value matched in the text"""
+        found = {}
+        for match in self.keyword_re.finditer(text_lower):
+            for name, value in self.hits[match.group(1)]:
+                rank = self.ranks[name][value]
+                if name not in found or rank < self.ranks[name][found[name]]:
+                    found[name] = value
+        return found
+
+
+def load_vocabulary(path=VOCABULARY_FILE):
+    """Compile a vocabulary file"""
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    return Vocabulary(config['tables'], config['actions'],
+                      config.get('cleanup_words', []), config.get('professional_accounts', []))
+
+
+class VocabularyFile:
+    """Compiled vocabulary for a config file, recompiled when the file changes
+
+    Requests read ``vocabulary`` without locking: a reload compiles the new matcher
+    off to the side and swaps it in with a single assignment. A broken edit is
+    reported and the previous vocabulary stays in use.
+    """
+
+    def __init__(self, path, interval=RELOAD_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._checked = time.monotonic()
+        self._key = None
+        self.vocabulary = None  # compiled on first use
+
+    def _file_key(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def get(self):
+        """Current vocabulary, checking the file for edits at most once per interval"""
+        if self.vocabulary is None:
+            with self._lock:
+                if self.vocabulary is None:
+                    self._key = self._file_key()
+                    self.vocabulary = load_vocabulary(self.path)
+        now = time.monotonic()
+        if now - self._checked >= self.interval and self._lock.acquire(blocking=False):
+            try:
+                self._checked = now
+                self.reload()
+            finally:
+                self._lock.release()
+        return self.vocabulary
+
+    def reload(self):
+        """Recompile if the file changed since the last load; returns True if swapped"""
+        key = self._file_key()
+        if key is None or key == self._key:
+            return False
+        self._key = key
+        try:
+            vocabulary = load_vocabulary(self.path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, re.error) as e:
+            print(f"⚠️  Could not reload {self.path} ({e}); keeping the previous vocabulary")
+            return False
+        self.vocabulary = vocabulary
+        print(f"🔄 Reloaded parser vocabulary from {self.path}")
+        return True
+
+
+_vocabulary = VocabularyFile(VOCABULARY_FILE)
+
+
+def parse_voice_input(text, vocabulary=None):
+    """Parse voice input and determine action and item details"""
+    vocab = vocabulary or _vocabulary.get()
+    start = time.perf_counter()
+    text = text.strip()
+    text_lower = text.lower()
+
+    result = {
+        'action': 'add',  # add, complete, update, delete
+        'item': '',
+        'category': 'Personal',
+        'project': '',
+        'context': '@Anywhere',
+        'priority': 'Medium',
+        'status': 'Next Action',
+        'next_action': '',
+        'notes': '',
+        'parsed_info': []
+    }
+
+    # Detect action
+    match = vocab.action_re.match(text)
+    if match:
+        result['action'] = vocab.actions[match.group(1).lower()]
+        text = text[match.end():]
+
+    found = vocab.scan(text_lower)
+
+    if 'category' in found:
+        result['category'] = found['category']
+        result['parsed_info'].append(f"Category: {found['category']}")
+
+    if 'priority' in found:
+        result['priority'] = found['priority']
+        result['parsed_info'].append(f"Priority: {found['priority']}")
+
+    if 'context' in found:
+        result['context'] = found['context']
+        result['parsed_info'].append(f"Context: {found['context']}")
+
+    if 'project' in found:
+        result['project'] = found['project']
+        result['parsed_info'].append(f"Project: {found['project']}")
+        if found['project'] in vocab.professional_accounts:
+            result['category'] = 'Professional'
+
+    status = found.get('status')
+    if status == 'Recurring':
+        # Plain "recurring" with no frequency keeps the default status
+        status = found.get('recurrence', result['status'])
+    if status:
+        result['status'] = status
+        result['parsed_info'].append(f'Status: {status}')
+
+    # Clean up the item text: drop the parsed keywords for a cleaner item name
+    result['item'] = vocab.cleanup_re.sub('', text).strip()
+    result['next_action'] = result['item']
+
+    PARSE_SECONDS.observe(time.perf_counter() - start)
+    return result
+
+
+SENTENCE_END_RE = re.compile(r'(?<=[.!?;])\s+|\s*\n+\s*')
+
+
+def split_transcript(transcript):
+    """Split a dictated brain-dump into one utterance per sentence or line"""
+    sentences = (s.strip().rstrip('.!?;').strip() for s in SENTENCE_END_RE.split(transcript or ''))
+    return [s for s in sentences if s]
+
+
+def parse_batch(texts):
+    """Parse many utterances against one vocabulary snapshot"""
+    vocab = _vocabulary.get()
+    return [parse_voice_input(text, vocab) for text in texts]
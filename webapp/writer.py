@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""GTD Voice App - Serialized, group-committed writes"""
+
+import contextlib
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+
+class FileLock:
+    """Advisory lock on a file, shared by every process (e.g. gunicorn workers) using the store"""
+
+    def __init__(self, path):
+        self.path = path
+
+    @contextlib.contextmanager
+    def hold(self, exclusive=True):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+
+
+class Writer:
+    """Single writer thread for the store
+
+    Request threads submit mutations and block until they are durable. The writer
+    drains everything queued so far and runs it inside one store transaction, so
+    concurrent captures share a single commit (one fsync / one SQLite COMMIT).
+    """
+
+    def __init__(self, store, max_batch=256):
+        self.store = store
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, name='gtd-writer', daemon=True).start()
+
+    def submit(self, fn, *args):
+        """Run fn(store, *args) on the writer thread and return its result once committed"""
+        future = Future()
+        self._queue.put((fn, args, future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._commit(batch)
+
+    def _commit(self, batch):
+        results = []
+        try:
+            with self.store.transaction():
+                for fn, args, future in batch:
+                    try:
+                        results.append((future, fn(self.store, *args), None))
+                    except Exception as e:
+                        results.append((future, None, e))
+        except Exception as e:
+            # The commit itself failed: nothing in the batch is durable
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        # Acknowledge only after the whole group is committed
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)